@@ -3,47 +3,83 @@
 Script to add 'cluster' parameter to all proxmox-* tool functions in server.py
 """
 
+import os
 import re
+import shutil
+import tempfile
+from typing import Iterable, Iterator
 
-def add_cluster_param_to_tools(content: str) -> str:
-    """Add cluster parameter to all proxmox tool functions."""
+# Matches: async def proxmox_xxx(...) -> ...
+_FUNC_DEF_RE = re.compile(r'(async def (proxmox_[a-z_]+)\((.*?)\) -> ([^\n]+):\n)', re.MULTILINE)
+# Matches: client = get_client()
+_GET_CLIENT_RE = re.compile(r'(\s+)client = get_client\(\)')
+
+
+def _replace_func(match: re.Match) -> str:
+    """Rewrite one matched tool signature to take a cluster parameter."""
+    full_match = match.group(0)
+    func_name = match.group(2)
+    params = match.group(3)
+    return_type = match.group(4)
     
-    # Pattern to match tool function definitions
-    # Matches: async def proxmox_xxx(...) -> ...
-    pattern = r'(async def (proxmox_[a-z_]+)\((.*?)\) -> ([^\n]+):\n)'
+    # Skip if already has cluster parameter
+    if 'cluster:' in params or 'cluster =' in params:
+        return full_match
     
-    def replace_func(match):
-        full_match = match.group(0)
-        func_name = match.group(2)
-        params = match.group(3)
-        return_type = match.group(4)
-        
-        # Skip if already has cluster parameter
-        if 'cluster:' in params or 'cluster =' in params:
-            return full_match
-        
-        # Add cluster parameter
-        if params.strip():
-            # Has other parameters
-            new_params = params + ', cluster: Optional[str] = None'
-        else:
-            # No parameters
-            new_params = 'cluster: Optional[str] = None'
-        
-        return f'async def {func_name}({new_params}) -> {return_type}:\n'
+    # Add cluster parameter
+    if params.strip():
+        # Has other parameters
+        new_params = params + ', cluster: Optional[str] = None'
+    else:
+        # No parameters
+        new_params = 'cluster: Optional[str] = None'
     
-    # Apply replacements
-    content = re.sub(pattern, replace_func, content, flags=re.MULTILINE)
+    return f'async def {func_name}({new_params}) -> {return_type}:\n'
+
+
+def _update_get_client_calls(text: str) -> str:
+    """Update get_client() calls to pass cluster parameter."""
+    if 'client = get_client()' not in text:
+        return text
+    return _GET_CLIENT_RE.sub(r'\1client = get_client(cluster)', text)
+
+
+def iter_updated_chunks(content: str) -> Iterator[str]:
+    """
+    Yield the updated source in pieces.
     
-    # Now update get_client() calls to pass cluster parameter
-    # Pattern: client = get_client()
-    content = re.sub(
-        r'(\s+)client = get_client\(\)',
-        r'\1client = get_client(cluster)',
-        content
-    )
+    Text between tool signatures is passed through (with get_client() calls
+    updated); only the matched signature windows are rewritten.
+    """
+    # Cheap substring checks gate the regex scans
+    if 'async def proxmox_' not in content:
+        yield _update_get_client_calls(content)
+        return
     
-    return content
+    pos = 0
+    for match in _FUNC_DEF_RE.finditer(content):
+        yield _update_get_client_calls(content[pos:match.start()])
+        yield _replace_func(match)
+        pos = match.end()
+    yield _update_get_client_calls(content[pos:])
+
+
+def add_cluster_param_to_tools(content: str) -> str:
+    """Add cluster parameter to all proxmox tool functions."""
+    return ''.join(iter_updated_chunks(content))
+
+
+def write_chunks(file_path: str, chunks: Iterable[str]) -> None:
+    """Write chunks to a temp file next to file_path, then atomically replace it."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', buffering=1 << 20) as f:
+            f.writelines(chunks)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def main():
@@ -59,12 +95,8 @@ def main():
     with open(file_path, 'r') as f:
         content = f.read()
     
-    # Process
-    new_content = add_cluster_param_to_tools(content)
-    
-    # Write back
-    with open(file_path, 'w') as f:
-        f.write(new_content)
+    # Process and write back
+    write_chunks(file_path, iter_updated_chunks(content))
     
     print(f"✅ Updated {file_path}")
     print("   - Added 'cluster' parameter to all proxmox-* tools")
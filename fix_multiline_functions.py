@@ -3,40 +3,78 @@
 Fix multi-line function signatures to add cluster parameter.
 """
 
+import os
 import re
+import shutil
+import tempfile
+from typing import Iterable, Iterator
 
-def fix_file(content: str) -> str:
-    """Fix all multi-line function signatures."""
+# Pattern: @server.tool(...)\nasync def proxmox_xxx(\n    params...\n) -> ReturnType:
+_TOOL_SIG_RE = re.compile(
+    r'(@server\.tool\([^)]+\)\n)(async def (proxmox_[a-z_]+)\(([^)]*(?:\n[^)]*)*)\) -> ([^\n]+):\n)',
+    re.MULTILINE,
+)
+
+
+def _replace_func(match: re.Match) -> str:
+    """Rewrite one matched multi-line tool signature to take a cluster parameter."""
+    decorator = match.group(1)
+    full_sig = match.group(0)
+    func_name = match.group(3)
+    params = match.group(4)
+    return_type = match.group(5)
     
-    # Find all function signatures that span multiple lines
-    # Pattern: async def proxmox_xxx(\n    params...\n) -> ReturnType:
+    # Skip if already has cluster parameter
+    if 'cluster:' in params or 'cluster =' in params:
+        return full_sig
     
-    pattern = r'(@server\.tool\([^)]+\)\n)(async def (proxmox_[a-z_]+)\(([^)]*(?:\n[^)]*)*)\) -> ([^\n]+):\n)'
+    # Add cluster parameter before the closing paren
+    # Find last parameter
+    if params.strip():
+        # Add cluster parameter
+        new_params = params + ',\n    cluster: Optional[str] = None'
+    else:
+        new_params = 'cluster: Optional[str] = None'
     
-    def replace_func(match):
-        decorator = match.group(1)
-        full_sig = match.group(0)
-        func_name = match.group(3)
-        params = match.group(4)
-        return_type = match.group(5)
-        
-        # Skip if already has cluster parameter
-        if 'cluster:' in params or 'cluster =' in params:
-            return full_sig
-        
-        # Add cluster parameter before the closing paren
-        # Find last parameter
-        if params.strip():
-            # Add cluster parameter
-            new_params = params + ',\n    cluster: Optional[str] = None'
-        else:
-            new_params = 'cluster: Optional[str] = None'
-        
-        return f'{decorator}async def {func_name}({new_params}) -> {return_type}:\n'
+    return f'{decorator}async def {func_name}({new_params}) -> {return_type}:\n'
+
+
+def iter_fixed_chunks(content: str) -> Iterator[str]:
+    """
+    Yield the fixed source in pieces.
     
-    content = re.sub(pattern, replace_func, content, flags=re.MULTILINE)
+    Text between tool signatures is passed through untouched; only the
+    matched signature windows are rewritten.
+    """
+    # Cheap substring check gates the regex scan
+    if '@server.tool(' not in content:
+        yield content
+        return
     
-    return content
+    pos = 0
+    for match in _TOOL_SIG_RE.finditer(content):
+        yield content[pos:match.start()]
+        yield _replace_func(match)
+        pos = match.end()
+    yield content[pos:]
+
+
+def fix_file(content: str) -> str:
+    """Fix all multi-line function signatures."""
+    return ''.join(iter_fixed_chunks(content))
+
+
+def write_chunks(file_path: str, chunks: Iterable[str]) -> None:
+    """Write chunks to a temp file next to file_path, then atomically replace it."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', buffering=1 << 20) as f:
+            f.writelines(chunks)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def main():
@@ -52,12 +90,8 @@ def main():
     with open(file_path, 'r') as f:
         content = f.read()
     
-    # Process
-    new_content = fix_file(content)
-    
-    # Write back
-    with open(file_path, 'w') as f:
-        f.write(new_content)
+    # Process and write back
+    write_chunks(file_path, iter_fixed_chunks(content))
     
     print(f"✅ Fixed {file_path}")
 
@@ -15,13 +15,22 @@ import sys
 import os
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Add project src to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root / "src"))
-os.environ["PYTHONPATH"] = str(project_root / "src")
+try:
+    import orjson  # Optional: much faster serializer for the results dump
+except ImportError:
+    orjson = None
+
+from dotenv import load_dotenv
+
+# Add project src to path when run as a script
+if __name__ == "__main__":
+    project_root = Path(__file__).parent
+    sys.path.insert(0, str(project_root / "src"))
+    os.environ["PYTHONPATH"] = str(project_root / "src")
 
 # Setup logging
 logging.basicConfig(
@@ -30,6 +39,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent API requests per fan-out
+MAX_WORKERS = 16
+
+# Report separators
+SEP = "=" * 80
+SUB = "-" * 80
+BYTES_TO_MB = 1 / (1024 * 1024)
+
+
+def _node_status_from_resource(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Adapt a /cluster/resources node entry to the shape of a node status."""
+    status = dict(entry)
+    if "mem" in entry or "maxmem" in entry:
+        status["memory"] = {"used": entry.get("mem"), "total": entry.get("maxmem")}
+    return status
+
 
 def list_all_resources_from_cluster(cluster_registry, cluster_name: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -45,188 +70,205 @@ def list_all_resources_from_cluster(cluster_registry, cluster_name: Optional[str
     resources = {}
     
     try:
-        logger.info(f"Fetching resources from cluster: {cluster_name or 'default'}")
+        logger.info("Fetching resources from cluster: %s", cluster_name or 'default')
         
         # Get client for cluster
         client = cluster_registry.get_client(cluster_name)
         
-        # List nodes
-        logger.info("Fetching nodes...")
-        try:
-            nodes = client.list_nodes()
-            resources["nodes"] = nodes
-            logger.info(f"  Found {len(nodes)} nodes")
-        except Exception as e:
-            logger.warning(f"  Error fetching nodes: {e}")
-            resources["nodes"] = []
-        
-        # List VMs
-        logger.info("Fetching VMs...")
-        try:
-            vms = client.list_vms()
-            resources["vms"] = vms
-            logger.info(f"  Found {len(vms)} VMs")
-        except Exception as e:
-            logger.warning(f"  Error fetching VMs: {e}")
-            resources["vms"] = []
-        
-        # List LXC containers
-        logger.info("Fetching LXC containers...")
-        try:
-            lxc_containers = client.list_lxc()
-            resources["lxc"] = lxc_containers
-            logger.info(f"  Found {len(lxc_containers)} LXC containers")
-        except Exception as e:
-            logger.warning(f"  Error fetching LXC containers: {e}")
-            resources["lxc"] = []
-        
-        # List storage
-        logger.info("Fetching storage...")
-        try:
-            storage = client.list_storage()
-            resources["storage"] = storage
-            logger.info(f"  Found {len(storage)} storage devices")
-        except Exception as e:
-            logger.warning(f"  Error fetching storage: {e}")
-            resources["storage"] = []
+        # Fetch nodes, VMs, LXC containers and storage concurrently
+        listings = [
+            ("nodes", "nodes", client.list_nodes),
+            ("vms", "VMs", client.list_vms),
+            ("lxc", "LXC containers", client.list_lxc),
+            ("storage", "storage devices", client.list_storage),
+        ]
+        logger.info("Fetching nodes, VMs, LXC containers and storage...")
+        with ThreadPoolExecutor(max_workers=len(listings)) as executor:
+            futures = {key: (label, executor.submit(fn)) for key, label, fn in listings}
+            for key, (label, future) in futures.items():
+                try:
+                    items = future.result()
+                    resources[key] = items
+                    logger.info("  Found %d %s", len(items), label)
+                except Exception as e:
+                    logger.warning("  Error fetching %s: %s", label, e)
+                    resources[key] = []
         
-        # Get node status for each node
+        # Get node status for each node: one cluster-wide call, then per-node
+        # requests only for nodes it did not cover
         if resources.get("nodes"):
             logger.info("Fetching node status...")
-            resources["node_status"] = {}
-            for node in resources["nodes"]:
-                try:
-                    node_name = node.get("node")
-                    if node_name:
-                        status = client.get_node_status(node_name)
-                        resources["node_status"][node_name] = status
-                except Exception as e:
-                    logger.warning(f"  Error getting status for node {node_name}: {e}")
+            node_names = [node.get("node") for node in resources["nodes"] if node.get("node")]
+            statuses: Dict[str, Any] = {}
+            try:
+                for entry in client.list_cluster_resources(type_="node"):
+                    if entry.get("node") in node_names:
+                        statuses[entry["node"]] = _node_status_from_resource(entry)
+            except Exception as e:
+                logger.warning("  Error fetching cluster node resources: %s", e)
+            
+            missing = [name for name in node_names if name not in statuses]
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(missing))) as executor:
+                    futures = {name: executor.submit(client.get_node_status, name) for name in missing}
+                    for node_name, future in futures.items():
+                        try:
+                            statuses[node_name] = future.result()
+                        except Exception as e:
+                            logger.warning("  Error getting status for node %s: %s", node_name, e)
+            
+            resources["node_status"] = {name: statuses[name] for name in node_names if name in statuses}
         
         return resources
         
     except Exception as e:
-        logger.error(f"Error fetching resources: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error fetching resources: %s", e)
         raise
 
 
-def format_resources_report(resources: Dict[str, Any], cluster_name: str) -> str:
-    """
-    Format resources into a readable report.
-    
-    Args:
-        resources: Dictionary of resources
-        cluster_name: Name of the cluster
-        
-    Returns:
-        Formatted report string
-    """
-    report = []
-    report.append("=" * 80)
-    report.append(f"PROXMOX CLUSTER RESOURCES - {cluster_name.upper()}")
-    report.append("=" * 80)
-    report.append("")
+def _memory_line(mem_bytes: Any) -> str:
+    """Return the report's memory line (with trailing newline), or "" when unknown."""
+    if not mem_bytes:
+        return ""
+    return f"    - Memory: {mem_bytes * BYTES_TO_MB:.2f} MB\n"
+
+
+def _emit_report_lines(resources: Dict[str, Any], cluster_name: str) -> Iterator[str]:
+    """Yield the lines of a resources report one at a time."""
+    yield SEP
+    yield f"PROXMOX CLUSTER RESOURCES - {cluster_name.upper()}"
+    yield SEP
+    yield ""
     
     # Nodes
-    report.append("📍 NODES:")
-    report.append("-" * 80)
+    yield "📍 NODES:"
+    yield SUB
     nodes = resources.get("nodes", [])
     if nodes:
         for node in nodes:
-            report.append(f"  • {node.get('node', 'N/A')}")
-            report.append(f"    - Status: {node.get('status', 'N/A')}")
-            report.append(f"    - Uptime: {node.get('uptime', 'N/A')} seconds")
+            g = node.get
+            yield (
+                f"  • {g('node', 'N/A')}\n"
+                f"    - Status: {g('status', 'N/A')}\n"
+                f"    - Uptime: {g('uptime', 'N/A')} seconds"
+            )
     else:
-        report.append("  No nodes found")
-    report.append("")
+        yield "  No nodes found"
+    yield ""
     
     # VMs
-    report.append("🖥️  VIRTUAL MACHINES:")
-    report.append("-" * 80)
+    yield "🖥️  VIRTUAL MACHINES:"
+    yield SUB
     vms = resources.get("vms", [])
     if vms:
-        report.append(f"  Total VMs: {len(vms)}")
-        report.append("")
+        yield f"  Total VMs: {len(vms)}"
+        yield ""
         for vm in vms[:10]:  # Show first 10
-            vm_name = vm.get('name', f"VM {vm.get('vmid', 'N/A')}")
-            vm_id = vm.get('vmid', 'N/A')
-            report.append(f"  • {vm_name} (ID: {vm_id})")
-            report.append(f"    - Status: {vm.get('status', 'N/A')}")
-            report.append(f"    - Node: {vm.get('node', 'N/A')}")
-            mem_bytes = vm.get('mem', 0)
-            if mem_bytes:
-                report.append(f"    - Memory: {mem_bytes / 1024 / 1024:.2f} MB")
-            report.append(f"    - CPU cores: {vm.get('cpus', 'N/A')}")
+            g = vm.get
+            vm_id = g('vmid', 'N/A')
+            yield (
+                f"  • {g('name', f'VM {vm_id}')} (ID: {vm_id})\n"
+                f"    - Status: {g('status', 'N/A')}\n"
+                f"    - Node: {g('node', 'N/A')}\n"
+                f"{_memory_line(g('mem', 0))}"
+                f"    - CPU cores: {g('cpus', 'N/A')}"
+            )
         if len(vms) > 10:
-            report.append(f"  ... and {len(vms) - 10} more VMs")
+            yield f"  ... and {len(vms) - 10} more VMs"
     else:
-        report.append("  No VMs found")
-    report.append("")
+        yield "  No VMs found"
+    yield ""
     
     # LXC Containers
-    report.append("📦 LXC CONTAINERS:")
-    report.append("-" * 80)
+    yield "📦 LXC CONTAINERS:"
+    yield SUB
     lxc = resources.get("lxc", [])
     if lxc:
-        report.append(f"  Total Containers: {len(lxc)}")
-        report.append("")
+        yield f"  Total Containers: {len(lxc)}"
+        yield ""
         for ct in lxc[:10]:  # Show first 10
-            ct_name = ct.get('name', f"Container {ct.get('vmid', 'N/A')}")
-            ct_id = ct.get('vmid', 'N/A')
-            report.append(f"  • {ct_name} (ID: {ct_id})")
-            report.append(f"    - Status: {ct.get('status', 'N/A')}")
-            report.append(f"    - Node: {ct.get('node', 'N/A')}")
-            mem_bytes = ct.get('mem', 0)
-            if mem_bytes:
-                report.append(f"    - Memory: {mem_bytes / 1024 / 1024:.2f} MB")
-            report.append(f"    - CPU cores: {ct.get('cpus', 'N/A')}")
+            g = ct.get
+            ct_id = g('vmid', 'N/A')
+            yield (
+                f"  • {g('name', f'Container {ct_id}')} (ID: {ct_id})\n"
+                f"    - Status: {g('status', 'N/A')}\n"
+                f"    - Node: {g('node', 'N/A')}\n"
+                f"{_memory_line(g('mem', 0))}"
+                f"    - CPU cores: {g('cpus', 'N/A')}"
+            )
         if len(lxc) > 10:
-            report.append(f"  ... and {len(lxc) - 10} more containers")
+            yield f"  ... and {len(lxc) - 10} more containers"
     else:
-        report.append("  No LXC containers found")
-    report.append("")
+        yield "  No LXC containers found"
+    yield ""
     
     # Storage
-    report.append("💾 STORAGE:")
-    report.append("-" * 80)
+    yield "💾 STORAGE:"
+    yield SUB
     storage = resources.get("storage", [])
     if storage:
-        report.append(f"  Total Storage: {len(storage)}")
-        report.append("")
+        yield f"  Total Storage: {len(storage)}"
+        yield ""
         for stg in storage:
-            report.append(f"  • {stg.get('storage', 'N/A')} ({stg.get('type', 'N/A')})")
-            report.append(f"    - Content: {stg.get('content', 'N/A')}")
-            report.append(f"    - Enabled: {stg.get('enabled', 'N/A')}")
-            report.append(f"    - Node: {stg.get('node', 'N/A')}")
+            g = stg.get
+            yield (
+                f"  • {g('storage', 'N/A')} ({g('type', 'N/A')})\n"
+                f"    - Content: {g('content', 'N/A')}\n"
+                f"    - Enabled: {g('enabled', 'N/A')}\n"
+                f"    - Node: {g('node', 'N/A')}"
+            )
     else:
-        report.append("  No storage found")
-    report.append("")
+        yield "  No storage found"
+    yield ""
     
     # Node Status
     node_status = resources.get("node_status", {})
     if node_status:
-        report.append("📊 NODE STATUS DETAILS:")
-        report.append("-" * 80)
+        yield "📊 NODE STATUS DETAILS:"
+        yield SUB
         for node_name, status in node_status.items():
-            report.append(f"  {node_name}:")
-            report.append(f"    - Status: {status.get('status', 'N/A')}")
-            report.append(f"    - Uptime: {status.get('uptime', 'N/A')} seconds")
-            report.append(f"    - CPU: {status.get('cpu', 'N/A')}")
-            mem_info = status.get('memory', {})
+            g = status.get
+            yield (
+                f"  {node_name}:\n"
+                f"    - Status: {g('status', 'N/A')}\n"
+                f"    - Uptime: {g('uptime', 'N/A')} seconds\n"
+                f"    - CPU: {g('cpu', 'N/A')}"
+            )
+            mem_info = g('memory', {})
             if isinstance(mem_info, dict):
-                report.append(f"    - Memory: {mem_info.get('used', 'N/A')} / {mem_info.get('total', 'N/A')} bytes")
-        report.append("")
+                yield f"    - Memory: {mem_info.get('used', 'N/A')} / {mem_info.get('total', 'N/A')} bytes"
+        yield ""
     
-    report.append("=" * 80)
+    yield SEP
+
+
+def format_resources_report(resources: Dict[str, Any], cluster_name: str) -> str:
+    """
+    Format resources into a readable report.
     
-    return "\n".join(report)
+    Args:
+        resources: Dictionary of resources
+        cluster_name: Name of the cluster
+        
+    Returns:
+        Formatted report string
+    """
+    return "\n".join(_emit_report_lines(resources, cluster_name))
+
+
+def save_results(results: Dict[str, Any], output_file: Path) -> None:
+    """Write results as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w") as f:
+            json.dump(results, f, indent=2, default=str)
 
 
 def main():
     """Main function."""
-    from dotenv import load_dotenv
+    # Deferred: importing proxmox_mcp loads the whole package
     from proxmox_mcp.cluster_manager import get_cluster_registry
     
     logger.info("Starting Proxmox Resource Listing")
@@ -245,31 +287,33 @@ def main():
     logger.info(f"Available clusters: {clusters}")
     logger.info(f"Default cluster: {registry._config.default_cluster}")
     
-    for cluster in clusters:
-        cluster_display = cluster
-        try:
-            logger.info(f"\n{'='*80}")
-            logger.info(f"Querying Cluster: {cluster_display}")
-            logger.info(f"{'='*80}")
-            
-            resources = list_all_resources_from_cluster(registry, cluster_name=cluster)
-            all_results[cluster_display] = resources
-            
-            # Print formatted report
-            report = format_resources_report(resources, cluster_display)
-            print(report)
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch resources from cluster '{cluster_display}': {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+    logger.info("\n%s", SEP)
+    logger.info("Querying Clusters: %s", ", ".join(clusters))
+    logger.info(SEP)
+    
+    # Query all clusters concurrently, then report in configured order
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(clusters) or 1)) as executor:
+        futures = {
+            cluster: executor.submit(list_all_resources_from_cluster, registry, cluster)
+            for cluster in clusters
+        }
+        for cluster_display, future in futures.items():
+            try:
+                resources = future.result()
+                all_results[cluster_display] = resources
+                
+                # Print formatted report
+                report = format_resources_report(resources, cluster_display)
+                print(report)
+                
+            except Exception as e:
+                logger.exception(f"Failed to fetch resources from cluster '{cluster_display}': {e}")
+                continue
     
     # Save results to JSON
     output_file = Path(__file__).parent / "proxmox_resources_output.json"
     try:
-        with open(output_file, "w") as f:
-            json.dump(all_results, f, indent=2, default=str)
+        save_results(all_results, output_file)
         logger.info(f"\nResults saved to: {output_file}")
     except Exception as e:
         logger.error(f"Failed to save results: {e}")
@@ -1,13 +1,36 @@
 from __future__ import annotations
 
 import os
+import socket
+import subprocess
+import tempfile
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+import requests
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter
 
 from .utils import parse_api_url, read_env, split_token_id
 
+# Keep-alive connections pooled per Proxmox host, enough for the concurrent
+# requests issued by the cluster registry and multi-cluster fan-out tools
+HTTP_POOL_MAXSIZE = 32
+
+
+def _pick_resource(candidates: List[Dict[str, Any]], node: Optional[str], kind: str) -> Tuple[int, str, Dict[str, Any]]:
+    """Narrow resolve candidates by node and return (vmid, node, resource) for the single match."""
+    if node:
+        candidates = [r for r in candidates if r.get("node") == node]
+
+    if not candidates:
+        raise ValueError(f"{kind} not found with given selector")
+    if len(candidates) > 1 and not node:
+        raise ValueError(f"Multiple {kind}s match name; specify node")
+
+    resource = candidates[0]
+    return int(resource["vmid"]), str(resource["node"]), resource
+
 
 class ProxmoxClient:
     """Wrapper around proxmoxer.ProxmoxAPI with helper methods and sane defaults."""
@@ -23,6 +46,7 @@ class ProxmoxClient:
         default_storage: Optional[str] = None,
         default_bridge: Optional[str] = None,
         timeout: int = 30,
+        session: Optional[requests.Session] = None,
     ) -> None:
         self.base_url = base_url
         self.token_id = token_id
@@ -36,14 +60,23 @@ class ProxmoxClient:
         url = parse_api_url(base_url)
         token_parts = split_token_id(token_id)
         self._api = ProxmoxAPI(
-            url["host"],
-            port=url["port"],
+            url.host,
+            port=url.port,
             user=token_parts["user"],
             token_name=token_parts["token_name"],
             token_value=token_secret,
             verify_ssl=verify,
             timeout=timeout,
         )
+        # proxmoxer keeps its requests session, which carries this client's
+        # credentials, in the API store. Take over only the connection pool of
+        # the caller's session (an earlier client for the same cluster) so its
+        # warm connections are reused, or widen the pool of a new one.
+        if session is not None:
+            adapter = session.get_adapter("https://")
+        else:
+            adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+        self._api._store["session"].mount("https://", adapter)
 
     @classmethod
     def from_env(cls) -> "ProxmoxClient":
@@ -63,6 +96,11 @@ class ProxmoxClient:
     def api(self) -> ProxmoxAPI:
         return self._api
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session (and keep-alive connection pool) used for API requests."""
+        return self._api._store["session"]
+
     # -------- Core discovery --------
     def list_nodes(self) -> List[Dict[str, Any]]:
         return self._api.nodes.get()
@@ -70,6 +108,11 @@ class ProxmoxClient:
     def get_node_status(self, node: str) -> Dict[str, Any]:
         return self._api.nodes(node).status.get()
 
+    def list_cluster_resources(self, type_: Optional[str] = None) -> List[Dict[str, Any]]:
+        if type_:
+            return self._api.cluster.resources.get(type=type_)
+        return self._api.cluster.resources.get()
+
     def list_vms(self, node: Optional[str] = None, status: Optional[str] = None, search: Optional[str] = None) -> List[Dict[str, Any]]:
         vms = self._api.cluster.resources.get(type="vm")
         if node:
@@ -101,17 +144,38 @@ class ProxmoxClient:
             candidates = [r for r in resources if r.get("name") == name]
         else:
             raise ValueError("Provide either vmid or name")
+        return _pick_resource(candidates, node, "VM")
 
-        if node:
-            candidates = [r for r in candidates if r.get("node") == node]
-
-        if not candidates:
-            raise ValueError("VM not found with given selector")
-        if len(candidates) > 1 and not node:
-            raise ValueError("Multiple VMs match name; specify node")
+    def resolve_vms_batch(self, targets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Resolve several VMs against a single cluster listing.
 
-        vm = candidates[0]
-        return int(vm["vmid"]), str(vm["node"]), vm
+        Each target is a dict with vmid or name, and optionally node, as for
+        resolve_vm. Results keep the order of targets: {"vmid", "node",
+        "resource"} on success, or {"error": message} for that target.
+        """
+        resources = self._api.cluster.resources.get(type="vm")
+        by_id: Dict[Any, List[Dict[str, Any]]] = {}
+        by_name: Dict[Any, List[Dict[str, Any]]] = {}
+        for r in resources:
+            by_id.setdefault(r.get("vmid"), []).append(r)
+            by_name.setdefault(r.get("name"), []).append(r)
+
+        results: List[Dict[str, Any]] = []
+        for target in targets:
+            vmid, name = target.get("vmid"), target.get("name")
+            try:
+                if vmid is not None:
+                    candidates = by_id.get(vmid, [])
+                elif name is not None:
+                    candidates = by_name.get(name, [])
+                else:
+                    raise ValueError("Provide either vmid or name")
+                vmid, node, vm = _pick_resource(candidates, target.get("node"), "VM")
+                results.append({"vmid": vmid, "node": node, "resource": vm})
+            except ValueError as e:
+                results.append({"error": str(e)})
+        return results
 
     def resolve_lxc(self, vmid: Optional[int] = None, name: Optional[str] = None, node: Optional[str] = None) -> Tuple[int, str, Dict[str, Any]]:
         resources = self._api.cluster.resources.get(type="lxc")
@@ -123,16 +187,7 @@ class ProxmoxClient:
         else:
             raise ValueError("Provide either vmid or name")
 
-        if node:
-            candidates = [r for r in candidates if r.get("node") == node]
-
-        if not candidates:
-            raise ValueError("LXC not found with given selector")
-        if len(candidates) > 1 and not node:
-            raise ValueError("Multiple LXCs match name; specify node")
-
-        ct = candidates[0]
-        return int(ct["vmid"]), str(ct["node"]), ct
+        return _pick_resource(candidates, node, "LXC")
 
     def vm_config(self, node: str, vmid: int) -> Dict[str, Any]:
         return self._api.nodes(node).qemu(vmid).config.get()
@@ -291,6 +346,12 @@ class ProxmoxClient:
             "net0": net0,
             "password": os.environ.get("PROXMOX_DEFAULT_LXC_PASSWORD", "changeMe123!"),
         }
+        # Optional host directory bind-mounted into every new container so apt
+        # archives and pip wheels are downloaded once (bind mounts need root@pam)
+        cache_dir = os.environ.get("PROXMOX_LXC_CACHE_DIR")
+        if cache_dir:
+            params["mp0"] = f"{cache_dir}/apt-archives,mp=/var/cache/apt/archives"
+            params["mp1"] = f"{cache_dir}/pip,mp=/root/.cache/pip"
         return self._api.nodes(node).lxc.post(**params)
 
     def delete_lxc(self, node: str, vmid: int, purge: bool = True) -> str:
@@ -496,9 +557,6 @@ class ProxmoxClient:
 
     def download_os_template(self, node: str, storage: str, template_name: str, template_url: str) -> str:
         """Download OS template from URL."""
-        import requests
-        import tempfile
-        
         # Download template to temporary file
         response = requests.get(template_url, stream=True)
         response.raise_for_status()
@@ -544,9 +602,6 @@ class ProxmoxClient:
     def create_cloudinit_iso(self, user_data: str, meta_data: Optional[str] = None, 
                             network_config: Optional[str] = None, output_path: str = "/tmp/cloudinit.iso") -> str:
         """Create CloudInit NoCloud ISO."""
-        import subprocess
-        import tempfile
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Write user-data
             with open(os.path.join(temp_dir, "user-data"), "w") as f:
@@ -656,9 +711,6 @@ class ProxmoxClient:
 
     def create_ignition_iso(self, ignition_json: str, output_path: str = "/tmp/ignition.iso") -> str:
         """Create Ignition ISO for RHCOS boot."""
-        import subprocess
-        import tempfile
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Write ignition.json
             with open(os.path.join(temp_dir, "ignition.json"), "w") as f:
@@ -695,9 +747,6 @@ class ProxmoxClient:
 
     def wait_for_vm_ssh(self, node: str, vmid: int, timeout: int = 300) -> bool:
         """Wait for VM to be accessible via SSH."""
-        import socket
-        import time
-        
         # Get VM IP from QEMU guest agent if available
         try:
             interfaces = self.qga_network_get_interfaces(node, vmid)
@@ -715,9 +764,11 @@ class ProxmoxClient:
             if not vm_ip:
                 return False
             
-            # Try to connect to SSH port
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            # Try to connect to SSH port, backing off 0.25s, 0.5s, 1s, ... up
+            # to 10s between probes so a fast boot is noticed right away
+            deadline = time.monotonic() + timeout
+            delay = 0.25
+            while True:
                 try:
                     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                     sock.settimeout(5)
@@ -729,9 +780,11 @@ class ProxmoxClient:
                 except Exception:
                     pass
                 
-                time.sleep(10)
-            
-            return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 10)
             
         except Exception:
             # If we can't get the IP or check SSH, assume it's not ready
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import os
+import subprocess
 import tempfile
 import yaml
 from typing import Any, Dict, List, Optional, Union
@@ -237,8 +238,6 @@ class CloudInitConfig:
     def create_iso(self, output_path: str, instance_id: str = "vm-instance", 
                    local_hostname: Optional[str] = None) -> str:
         """Create CloudInit NoCloud ISO with user-data and meta-data."""
-        import subprocess
-        
         # Create temporary directory for ISO content
         with tempfile.TemporaryDirectory() as temp_dir:
             # Write user-data
@@ -408,8 +407,7 @@ def get_ubuntu_web_server_config(hostname: str, ssh_keys: List[str], admin_user:
     config.add_user(admin_user, ssh_keys)
     config.add_packages(["nginx", "ufw", "certbot", "python3-certbot-nginx"])
     config.add_commands([
-        "systemctl enable nginx",
-        "systemctl start nginx", 
+        "systemctl enable --now nginx",
         "ufw allow 'Nginx Full'",
         "ufw allow ssh",
         "ufw --force enable"
@@ -425,8 +423,7 @@ def get_docker_host_config(hostname: str, ssh_keys: List[str], admin_user: str =
     config.add_packages(["docker.io", "docker-compose", "curl"])
     config.add_commands([
         f"usermod -aG docker {admin_user}",
-        "systemctl enable docker",
-        "systemctl start docker"
+        "systemctl enable --now docker"
     ])
     return config
 
@@ -442,7 +439,6 @@ def get_development_config(hostname: str, ssh_keys: List[str], admin_user: str =
     ])
     config.add_commands([
         f"usermod -aG docker {admin_user}",
-        "systemctl enable docker",
-        "systemctl start docker"
+        "systemctl enable --now docker"
     ])
     return config
@@ -8,10 +8,11 @@ and caching of ProxmoxClient instances.
 from __future__ import annotations
 
 import logging
-import re
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .utils import ClusterConfig, ClusterRegistryConfig, load_cluster_registry_config, is_multi_cluster_mode
 from .client import ProxmoxClient
@@ -21,23 +22,29 @@ logger = logging.getLogger(__name__)
 
 class ClusterError(Exception):
     """Base exception for cluster-related errors."""
-    pass
+    __slots__ = ()
 
 
 class ClusterNotFoundError(ClusterError):
     """Raised when a cluster is not found in the registry."""
+    __slots__ = ()
+    
     def __init__(self, cluster_name: str):
         super().__init__(f"Cluster not found: {cluster_name}")
 
 
 class ClusterConnectionError(ClusterError):
     """Raised when unable to connect to a cluster."""
+    __slots__ = ()
+    
     def __init__(self, cluster_name: str, reason: str):
         super().__init__(f"Cannot connect to cluster '{cluster_name}': {reason}")
 
 
 class AmbiguousClusterSelectionError(ClusterError):
     """Raised when cluster selection is ambiguous."""
+    __slots__ = ()
+    
     def __init__(self, resource_name: str, candidates: List[str]):
         super().__init__(
             f"Ambiguous cluster selection for '{resource_name}'. "
@@ -64,15 +71,44 @@ class ClusterRegistry:
             config: ClusterRegistryConfig instance. If None, loads from environment.
         """
         self._config = config or load_cluster_registry_config()
-        self._clients: Dict[str, ProxmoxClient] = {}  # Cache of ProxmoxClient instances
-        self._client_timestamps: Dict[str, float] = {}  # Timestamp of client creation
+        self._cache: Dict[str, Tuple[ProxmoxClient, float]] = {}  # Cached (client, monotonic creation time)
         self._is_multi_cluster = is_multi_cluster_mode()
+        self._pattern_items = tuple(self._config.cluster_patterns.items())
+        self._pattern_prefixes = tuple(self._config.cluster_patterns)
+        self._cluster_names = frozenset(self._config.clusters)
+        # Per-registry memo of _match_resource; the patterns are fixed for the
+        # registry's lifetime, so the resource name alone is the key
+        self._match_resource_cached = lru_cache(maxsize=1024)(self._match_resource)
+        # ProxmoxClient constructor kwargs per cluster, reused whenever a client is (re)created
+        self._client_kwargs: Dict[str, Dict[str, Any]] = {
+            name: {
+                "base_url": c.base_url,
+                "token_id": c.token_id,
+                "token_secret": c.token_secret,
+                "verify": c.verify,
+                "default_node": c.default_node,
+                "default_storage": c.default_storage,
+                "default_bridge": c.default_bridge,
+            }
+            for name, c in self._config.clusters.items()
+        }
+        # Sole cluster name in single-cluster setups, for selection fast paths
+        self._single_cluster_name: Optional[str] = (
+            next(iter(self._config.clusters)) if len(self._config.clusters) == 1 else None
+        )
+        self._refresh_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
         
         logger.info(
-            f"Initialized ClusterRegistry with {len(self._config.clusters)} cluster(s). "
-            f"Default: {self._config.default_cluster}. "
-            f"Multi-cluster mode: {self._is_multi_cluster}"
+            "Initialized ClusterRegistry with %d cluster(s). Default: %s. Multi-cluster mode: %s",
+            len(self._config.clusters),
+            self._config.default_cluster,
+            self._is_multi_cluster,
         )
+        
+        if self._config.prewarm:
+            self.prewarm()
+            self.start_background_refresh()
     
     def get_config(self) -> ClusterRegistryConfig:
         """Get the registry configuration."""
@@ -112,45 +148,96 @@ class ClusterRegistry:
         Raises:
             ClusterNotFoundError: If cluster not found
         """
-        target_cluster = cluster_name or self._config.default_cluster
-        
-        if target_cluster not in self._config.clusters:
-            raise ClusterNotFoundError(target_cluster)
+        if cluster_name is None and self._single_cluster_name is not None:
+            target_cluster = self._single_cluster_name
+        else:
+            target_cluster = cluster_name or self._config.default_cluster
+            if target_cluster not in self._config.clusters:
+                raise ClusterNotFoundError(target_cluster)
         
         # Check cache and TTL
-        if target_cluster in self._clients:
-            age = time.time() - self._client_timestamps.get(target_cluster, 0)
-            if age < self._config.cache_ttl:
-                logger.debug(f"Using cached client for cluster '{target_cluster}'")
-                return self._clients[target_cluster]
-            else:
-                logger.debug(f"Client cache expired for cluster '{target_cluster}'")
-                del self._clients[target_cluster]
-                del self._client_timestamps[target_cluster]
-        
-        # Create new client
-        cluster_config = self._config.clusters[target_cluster]
+        entry = self._cache.get(target_cluster)
+        if entry is not None:
+            client, created = entry
+            if time.monotonic() - created < self._config.cache_ttl:
+                logger.debug("Using cached client for cluster '%s'", target_cluster)
+                return client
+            logger.debug("Client cache expired for cluster '%s'", target_cluster)
+        
+        return self._create_client(target_cluster)
+    
+    def _create_client(self, target_cluster: str) -> ProxmoxClient:
+        """
+        Create a ProxmoxClient for a cluster and store it in the cache.
+        
+        A client replacing an expired one takes over its HTTP connection pool, so
+        open keep-alive connections survive and no new TLS handshake is needed.
+        """
+        previous = self._cache.get(target_cluster)
         try:
             client = ProxmoxClient(
-                base_url=cluster_config.base_url,
-                token_id=cluster_config.token_id,
-                token_secret=cluster_config.token_secret,
-                verify=cluster_config.verify,
-                default_node=cluster_config.default_node,
-                default_storage=cluster_config.default_storage,
-                default_bridge=cluster_config.default_bridge,
+                **self._client_kwargs[target_cluster],
+                session=previous[0].session if previous is not None else None,
             )
             
-            self._clients[target_cluster] = client
-            self._client_timestamps[target_cluster] = time.time()
+            self._cache[target_cluster] = (client, time.monotonic())
             
-            logger.info(f"Created new ProxmoxClient for cluster '{target_cluster}'")
+            logger.info("Created new ProxmoxClient for cluster '%s'", target_cluster)
             return client
             
         except Exception as e:
-            logger.error(f"Failed to create client for cluster '{target_cluster}': {e}")
+            logger.error("Failed to create client for cluster '%s': %s", target_cluster, e)
             raise ClusterConnectionError(target_cluster, str(e))
     
+    def prewarm(self) -> None:
+        """Create clients for all clusters concurrently so first requests hit the cache."""
+        cluster_names = self.list_clusters()
+        if not cluster_names:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(cluster_names))) as executor:
+            futures = {name: executor.submit(self.get_client, name) for name in cluster_names}
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except ClusterError as e:
+                    logger.warning("Prewarm failed for cluster '%s': %s", name, e)
+    
+    def start_background_refresh(self) -> None:
+        """
+        Start a daemon thread that recreates cached clients shortly before
+        their TTL expires, so expiry never happens on a request path.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="cluster-client-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+    
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh thread, if running."""
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+    
+    def _refresh_loop(self) -> None:
+        """Recreate cached clients that are within the refresh margin of expiry."""
+        margin = min(60.0, self._config.cache_ttl / 10)
+        interval = max(1.0, margin / 2)
+        
+        while not self._refresh_stop.wait(interval):
+            now = time.monotonic()
+            for name, (_, created) in list(self._cache.items()):
+                if now - created >= self._config.cache_ttl - margin:
+                    try:
+                        self._create_client(name)
+                    except ClusterError as e:
+                        logger.warning("Background refresh failed for cluster '%s': %s", name, e)
+    
     def select_cluster(
         self,
         cluster_name: Optional[str] = None,
@@ -178,11 +265,15 @@ class ClusterRegistry:
             ClusterNotFoundError: If no cluster can be selected
             AmbiguousClusterSelectionError: If selection is ambiguous
         """
+        # Single-cluster setups have nothing to choose between
+        if cluster_name is None and self._single_cluster_name is not None:
+            return self._single_cluster_name
+        
         # Priority 1: Explicit cluster name
         if cluster_name:
             if cluster_name not in self._config.clusters:
                 raise ClusterNotFoundError(cluster_name)
-            logger.debug(f"Cluster selected explicitly: {cluster_name}")
+            logger.debug("Cluster selected explicitly: %s", cluster_name)
             return cluster_name
         
         # Priority 2: Pattern matching on resource name
@@ -190,13 +281,13 @@ class ClusterRegistry:
             matched_clusters = self._match_resource_to_clusters(resource_name)
             
             if len(matched_clusters) == 1:
-                logger.debug(f"Cluster selected by resource name pattern: {matched_clusters[0]}")
+                logger.debug("Cluster selected by resource name pattern: %s", matched_clusters[0])
                 return matched_clusters[0]
             elif len(matched_clusters) > 1:
                 raise AmbiguousClusterSelectionError(resource_name, matched_clusters)
         
         # Priority 4: Default cluster
-        logger.debug(f"Using default cluster: {self._config.default_cluster}")
+        logger.debug("Using default cluster: %s", self._config.default_cluster)
         return self._config.default_cluster
     
     def _match_resource_to_clusters(self, resource_name: str) -> List[str]:
@@ -209,52 +300,72 @@ class ClusterRegistry:
         Returns:
             List of matching cluster names
         """
+        return list(self._match_resource_cached(resource_name))
+    
+    def _match_resource(self, resource_name: str) -> Tuple[str, ...]:
+        """
+        Match resource name to clusters (memoized per registry by _match_resource_to_clusters).
+        
+        Args:
+            resource_name: Name of the resource
+            
+        Returns:
+            Tuple of matching cluster names, in pattern order
+        """
         matched = []
         
-        # Try configured patterns first
-        for pattern, cluster_name in self._config.cluster_patterns.items():
-            if resource_name.startswith(pattern):
-                matched.append(cluster_name)
+        # Try configured patterns first; one C-level startswith() rejects misses
+        if self._pattern_prefixes and resource_name.startswith(self._pattern_prefixes):
+            for pattern, cluster_name in self._pattern_items:
+                if resource_name.startswith(pattern):
+                    matched.append(cluster_name)
         
         if matched:
-            return list(set(matched))  # Remove duplicates
+            return tuple(dict.fromkeys(matched))  # Remove duplicates, keep order
         
         # Try naming convention: {cluster_name}-{resource_type}-{identifier}
         # Example: prod-vm-web01 -> prod -> cluster named 'prod'
-        parts = resource_name.split("-")
-        if parts:
-            potential_cluster = parts[0]
-            if potential_cluster in self._config.clusters:
-                matched.append(potential_cluster)
+        potential_cluster = resource_name.partition("-")[0]
+        if potential_cluster and potential_cluster in self._cluster_names:
+            matched.append(potential_cluster)
         
-        return matched
+        return tuple(matched)
     
     def validate_all_clusters(self) -> Dict[str, Tuple[bool, str]]:
         """
         Validate connectivity to all clusters.
         
+        Clusters are checked concurrently.
+        
         Returns:
             Dict mapping cluster names to (is_valid, message) tuples
         """
-        results = {}
-        
-        for cluster_name in self._config.clusters:
-            try:
-                client = self.get_client(cluster_name)
-                # Try a simple API call
-                nodes = client.list_nodes()
-                results[cluster_name] = (True, f"OK ({len(nodes)} nodes)")
-                logger.info(f"Cluster '{cluster_name}' is healthy")
-            except Exception as e:
-                results[cluster_name] = (False, str(e))
-                logger.warning(f"Cluster '{cluster_name}' validation failed: {e}")
-        
-        return results
+        cluster_names = list(self._config.clusters)
+        if not cluster_names:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(cluster_names))) as executor:
+            futures = {name: executor.submit(self._validate_one, name) for name in cluster_names}
+            return {name: future.result() for name, future in futures.items()}
+    
+    def _validate_one(self, cluster_name: str) -> Tuple[bool, str]:
+        """Validate connectivity to a single cluster."""
+        try:
+            client = self.get_client(cluster_name)
+            # Try a simple API call
+            nodes = client.list_nodes()
+            logger.info("Cluster '%s' is healthy", cluster_name)
+            return (True, f"OK ({len(nodes)} nodes)")
+        except Exception as e:
+            logger.warning("Cluster '%s' validation failed: %s", cluster_name, e)
+            return (False, str(e))
     
     def get_cluster_info(self, cluster_name: Optional[str] = None) -> Dict:
         """
         Get detailed information about a cluster.
         
+        The node, VM, LXC and storage listings are fetched concurrently.
+        
         Args:
             cluster_name: Cluster name. If None, uses default.
             
@@ -266,10 +377,15 @@ class ClusterRegistry:
         
         try:
             client = self.get_client(target_cluster)
-            nodes = client.list_nodes()
-            vms = client.list_vms()
-            lxcs = client.list_lxc()
-            storages = client.list_storage()
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                nodes_future = executor.submit(client.list_nodes)
+                vms_future = executor.submit(client.list_vms)
+                lxcs_future = executor.submit(client.list_lxc)
+                storages_future = executor.submit(client.list_storage)
+                nodes = nodes_future.result()
+                vms = vms_future.result()
+                lxcs = lxcs_future.result()
+                storages = storages_future.result()
             
             return {
                 "cluster_name": target_cluster,
@@ -284,7 +400,7 @@ class ClusterRegistry:
                 "status": "online",
             }
         except Exception as e:
-            logger.error(f"Failed to get cluster info for '{target_cluster}': {e}")
+            logger.error("Failed to get cluster info for '%s': %s", target_cluster, e)
             return {
                 "cluster_name": target_cluster,
                 "api_url": config.base_url,
@@ -298,14 +414,17 @@ class ClusterRegistry:
         """
         Get information about all clusters.
         
+        Clusters are queried concurrently; results keep registry order.
+        
         Returns:
             List of cluster information dicts
         """
-        results = []
-        for cluster_name in self.list_clusters():
-            info = self.get_cluster_info(cluster_name)
-            results.append(info)
-        return results
+        cluster_names = self.list_clusters()
+        if not cluster_names:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(cluster_names))) as executor:
+            return list(executor.map(self.get_cluster_info, cluster_names))
     
     def clear_cache(self, cluster_name: Optional[str] = None) -> None:
         """
@@ -315,13 +434,11 @@ class ClusterRegistry:
             cluster_name: Specific cluster to clear. If None, clears all.
         """
         if cluster_name:
-            if cluster_name in self._clients:
-                del self._clients[cluster_name]
-                del self._client_timestamps[cluster_name]
-                logger.info(f"Cleared cache for cluster '{cluster_name}'")
+            if self._cache.pop(cluster_name, None) is not None:
+                logger.info("Cleared cache for cluster '%s'", cluster_name)
         else:
-            self._clients.clear()
-            self._client_timestamps.clear()
+            self._cache.clear()
+            self._match_resource_cached.cache_clear()
             logger.info("Cleared cache for all clusters")
     
     def __repr__(self) -> str:
@@ -5,19 +5,531 @@ Provides tools for executing commands, managing files, and monitoring containers
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import atexit
+import logging
+import mmap
 import os
+import posixpath
+import re
+import selectors
+import shlex
 import subprocess
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import pybase64 as b64  # SIMD-accelerated, API-compatible with base64
+except ImportError:
+    import base64 as b64
+
+try:
+    import asyncssh  # optional: in-process pooled SSH for host commands
+except ImportError:
+    asyncssh = None
+
+try:
+    import zstandard  # optional: compresses base64 file transfers
+except ImportError:
+    zstandard = None
 
 from .utils import require_confirm
 
+logger = logging.getLogger(__name__)
+
+# pybase64 selects its fastest kernel (AVX512VBMI, AVX2, ...) for this CPU at
+# runtime; record which one is active, e.g. "1.4.0 (C extension active - AVX2)"
+BASE64_BACKEND = b64.get_version() if hasattr(b64, "get_version") else "stdlib base64"
+logger.debug("Base64 backend: %s", BASE64_BACKEND)
+
+# Default timeout (seconds) for SSH commands
+DEFAULT_TIMEOUT = 30
+
+# How long an idle SSH master connection is kept alive for reuse
+SSH_CONTROL_PERSIST = 60
+
+# sshd's default MaxSessions: channels a single multiplexed connection may carry
+SSH_MAX_SESSIONS = 10
+
+# Persistent container shells kept open per host. Each holds a channel on the
+# master, so the rest of SSH_MAX_SESSIONS is left for one-shot commands
+_MAX_PCT_SESSIONS_PER_HOST = SSH_MAX_SESSIONS // 2
+
+# Prefix marking zstd-compressed base64 output (':' is outside the base64 alphabet)
+_ZSTD_TAG = "zstd:"
+
+# Errors raised while decoding a pulled file: bad base64, or a corrupt zstd payload
+_PULL_DECODE_ERRORS = (ValueError, zstandard.ZstdError) if zstandard is not None else (ValueError,)
+
+# Read size when streaming a file for base64 push (a multiple of 3)
+_STREAM_WINDOW = 48 * 1024
+
+# Ping timeout (seconds) for each probe in wait_for_container_network
+NETWORK_PROBE_TIMEOUT = 2
+
+# (ssh_user, host) pairs whose master was started (or confirmed alive), with
+# the monotonic time it was last used. Shared by all instances in this process.
+# Keyed per target because the control path itself is the unexpanded %C template.
+_ssh_masters: Dict[Tuple[str, str], float] = {}
+
+
+@lru_cache(maxsize=1)
+def _discover_ssh_key() -> str:
+    """Return the first SSH key found in the common locations (cached per process)."""
+    for key_path in [
+        "~/.ssh/id_openclaw",
+        "~/.ssh/id_openssh",
+        "~/.ssh/id_rsa",
+        "~/.ssh/id_ed25519"
+    ]:
+        expanded = os.path.expanduser(key_path)
+        if os.path.exists(expanded):
+            return expanded
+    raise ValueError("Could not find SSH key. Provide ssh_key parameter.")
+
+
+@lru_cache(maxsize=1)
+def _control_dir() -> str:
+    """
+    Private (0700) directory for this user's SSH multiplexing sockets.
+    
+    Uses $XDG_RUNTIME_DIR or ~/.ssh, never a shared directory such as /tmp
+    where another user could plant or hijack a socket. If neither is
+    writable, a fresh directory from mkdtemp (also 0700) is used.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser("~/.ssh")
+    path = os.path.join(base, "mcp-ssh")
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        os.chmod(path, 0o700)
+    except OSError:
+        path = tempfile.mkdtemp(prefix="mcp-ssh-")
+    return path
+
+
+# Round-trip time in ping output, e.g. "time=0.045 ms"
+_PING_TIME_RE = re.compile(r'time=(\d+(?:\.\d+)?)\s*ms')
+
+# Section markers for get_container_config's batched command
+_NET_MARKER = "---MCP-NET---"
+_RES_MARKER = "---MCP-RES---"
+_END_MARKER = "---MCP-END---"
+
+_CONFIG_SCRIPT = (
+    f"cat /etc/hostname; echo \"{_NET_MARKER} $?\"; "
+    f"ip addr show; echo \"{_RES_MARKER} $?\"; "
+    f"free -h && df -h /; echo \"{_END_MARKER} $?\""
+)
+
+
+def _split_config_output(output: str) -> Dict[str, Tuple[str, bool]]:
+    """Split _CONFIG_SCRIPT output into {section: (text, succeeded)}."""
+    sections: Dict[str, Tuple[str, bool]] = {}
+    rest = output
+    for name, marker in (("hostname", _NET_MARKER), ("network", _RES_MARKER), ("resources", _END_MARKER)):
+        text, found, rest = rest.partition(marker)
+        if not found:
+            break
+        status, _, rest = rest.lstrip(" ").partition("\n")
+        sections[name] = (text.strip(), status.strip() == "0")
+    return sections
+
+
+# Section markers for get_service_status; the status section comes first
+_SERVICE_MARKERS = ("---MCP-LOGS---", "---MCP-PID---", "---MCP-UPTIME---", "---MCP-ACTIVE---")
+
+# Wrapper for exec_in_container(tail_lines=N): spool output in the container
+# and send back only its tail, keeping the command's exit status
+_TAIL_SCRIPT = (
+    'out=$(mktemp) && err=$(mktemp) || exit 1\n'
+    'trap \'rm -f "$out" "$err"\' EXIT\n'
+    '( {command}\n) >"$out" 2>"$err"; rc=$?\n'
+    'tail -n {lines} "$out"; tail -n {lines} "$err" >&2; exit $rc\n'
+)
+
+
+def _container_shell(command: str) -> str:
+    """Host-shell text that runs command in a fresh ``sh -c`` inside the container, stdin closed."""
+    return f"sh -c {shlex.quote(command)} </dev/null"
+
+
+def _parse_delimited(output: str, markers: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Split output on marker lines into {marker: section text}.
+    
+    Text before the first marker is returned under the "" key. Markers that
+    do not appear in output are omitted.
+    """
+    sections: Dict[str, str] = {}
+    name, rest = "", output
+    for marker in markers:
+        text, found, after = rest.partition(marker)
+        if not found:
+            continue
+        sections[name] = text.strip()
+        name, rest = marker, after
+    sections[name] = rest.strip()
+    return sections
+
+
+# Fields pulled out of the `ip addr show`, `free -h` and `df -h /` sections
+_IP_RE = re.compile(r'inet (\d+\.\d+\.\d+\.\d+)/(\d+)')
+_MEM_RE = re.compile(r'^Mem:\s+(\S+)\s+(\S+)', re.MULTILINE)
+_DF_RE = re.compile(r'^\S+\s+(\S+)\s+(\S+)\s+(\S+)\s+(\d+)%\s+/$', re.MULTILINE)
+
+
+def _parse_config_fields(network: Optional[str], resources: Optional[str]) -> Dict[str, Any]:
+    """Extract the primary IPv4 address, memory and root disk usage; None where absent."""
+    ip = None
+    for match in _IP_RE.finditer(network or ""):
+        if not match.group(1).startswith("127."):
+            ip = match.group(1)
+            break
+    
+    mem = _MEM_RE.search(resources or "")
+    disk = _DF_RE.search(resources or "")
+    return {
+        "ip": ip,
+        "mem_total": mem.group(1) if mem else None,
+        "mem_used": mem.group(2) if mem else None,
+        "disk_used_pct": int(disk.group(4)) if disk else None
+    }
+
+
+def _transfer_result(success: bool, message: str, file_size: int = 0) -> Dict[str, Any]:
+    """Build the result dict returned by the push/pull/write methods."""
+    return {"success": success, "message": message, "file_size": file_size}
+
+
+def _iter_base64(f: BinaryIO, compress: bool = False) -> Iterator[bytes]:
+    """
+    Yield the base64 encoding of file f in fixed-size pieces.
+    
+    The file is memory-mapped and encoded straight from the page cache, so no
+    read copies are made and only the current window is resident. Pieces are
+    encoded from multiples of 3 bytes so they concatenate into one valid
+    base64 stream; only the last may carry padding.
+    
+    Args:
+        f: File opened in binary mode
+        compress: zstd-compress the data before encoding (needs zstandard)
+    """
+    compressor = zstandard.ZstdCompressor().compressobj() if compress else None
+    pending = b""
+    size = os.fstat(f.fileno()).st_size
+    # mmap cannot map an empty file
+    if size:
+        with mmap.mmap(f.fileno(), size, prot=mmap.PROT_READ) as mm, memoryview(mm) as view:
+            data = None
+            try:
+                for offset in range(0, size, _STREAM_WINDOW):
+                    data = view[offset:offset + _STREAM_WINDOW]
+                    if compressor is not None:
+                        data = compressor.compress(data)
+                    if pending:
+                        data = pending + data
+                    cut = len(data) - len(data) % 3
+                    if cut:
+                        yield b64.b64encode(data[:cut])
+                    pending = bytes(data[cut:])
+            finally:
+                # Drop the last slice so the map can be closed
+                data = None
+    if compressor is not None:
+        pending += compressor.flush()
+    if pending:
+        yield b64.b64encode(pending)
+
+
+class _PctSession:
+    """
+    A long-lived ``sh`` inside one container, fed commands over ssh stdin.
+    
+    Saves the ssh connect and ``pct exec`` setup cost on every command after
+    the first. Each command's end is detected by a unique marker that also
+    carries its exit status.
+    """
+    
+    __slots__ = ("_proc", "lock", "last_used")
+    
+    def __init__(self, ssh_args: List[str]):
+        self._proc = subprocess.Popen(
+            ssh_args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        # Scripts are written from run()'s select loop, so a full pipe never
+        # blocks before the output is drained or the deadline is checked
+        os.set_blocking(self._proc.stdin.fileno(), False)
+        self.lock = threading.Lock()
+        self.last_used = time.monotonic()
+    
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+    
+    def close(self) -> None:
+        if self.alive():
+            self._proc.kill()
+        self._proc.wait()
+        for stream in (self._proc.stdin, self._proc.stdout, self._proc.stderr):
+            stream.close()
+    
+    def run(self, command: str, timeout: float) -> Tuple[int, str, str]:
+        """
+        Run command in the session shell.
+        
+        Raises:
+            BrokenPipeError: If the shell had already exited (command not run)
+        
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        self.last_used = time.monotonic()
+        marker = f"__MCP_END_{uuid.uuid4().hex}__"
+        # Each command gets its own child shell, so cd, export, set -e, exit
+        # and syntax errors stay with that command and the session shell is
+        # untouched. stdin is redirected so it cannot consume the session's input.
+        script = (
+            f"{_container_shell(command)}\n"
+            f"printf '\\n{marker}%s\\n' \"$?\"\n"
+            f"printf '\\n{marker}\\n' >&2\n"
+        )
+        pending = memoryview(script.encode())
+        written = 0
+        
+        out_end = re.compile(rb"\n" + marker.encode() + rb"(\d+)\n")
+        err_end = b"\n" + marker.encode() + b"\n"
+        out, err = bytearray(), bytearray()
+        out_match = None
+        err_done = False
+        deadline = time.monotonic() + timeout
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._proc.stdin, selectors.EVENT_WRITE)
+            selector.register(self._proc.stdout, selectors.EVENT_READ, out)
+            selector.register(self._proc.stderr, selectors.EVENT_READ, err)
+            while out_match is None or not err_done:
+                remaining = deadline - time.monotonic()
+                events = selector.select(remaining) if remaining > 0 else []
+                if not events:
+                    self.close()
+                    return 124, "", f"Command timed out after {timeout}s"
+                for key, _ in events:
+                    if key.fileobj is self._proc.stdin:
+                        try:
+                            n = os.write(key.fd, pending[written:])
+                        except BlockingIOError:
+                            continue
+                        except BrokenPipeError:
+                            if not written:
+                                raise
+                            # The shell died mid-script; its output EOF
+                            # reports the failure
+                            selector.unregister(key.fileobj)
+                            continue
+                        written += n
+                        if written == len(pending):
+                            selector.unregister(key.fileobj)
+                        continue
+                    chunk = os.read(key.fileobj.fileno(), 65536)
+                    if not chunk:
+                        # The session shell itself died before reporting a
+                        # status (e.g. the container does not exist), so the
+                        # command's status is unknown: report ssh/pct's
+                        # failure code, or 255 if they exited cleanly
+                        self.close()
+                        return (
+                            self._proc.returncode or 255,
+                            out.decode('utf-8', 'replace'),
+                            err.decode('utf-8', 'replace'),
+                        )
+                    buf = key.data
+                    start = max(0, len(buf) - len(marker) - 16)
+                    buf += chunk
+                    if buf is out:
+                        out_match = out_end.search(out, start)
+                    elif err_end in err[start:]:
+                        err_done = True
+        
+        stdout = out[:out_match.start()].decode('utf-8', 'replace')
+        stderr = err[:err.rindex(err_end)].decode('utf-8', 'replace')
+        return int(out_match.group(1)), stdout, stderr
+
+
+# Persistent container shells shared across instances, keyed by (user, host, vmid)
+_pct_sessions: Dict[Tuple[str, str, int], _PctSession] = {}
+_pct_sessions_lock = threading.Lock()
+
+
+def _close_idle_sessions(max_idle: float = SSH_CONTROL_PERSIST) -> None:
+    """Close sessions that have not been used for max_idle seconds. Caller holds the lock."""
+    now = time.monotonic()
+    for key, session in list(_pct_sessions.items()):
+        if not session.lock.locked() and now - session.last_used > max_idle:
+            session.close()
+            del _pct_sessions[key]
+
+
+def _evict_lru_session(ssh_user: str, host: str) -> bool:
+    """
+    Make room for a new session on host by closing its least recently used
+    idle one, if the host is at _MAX_PCT_SESSIONS_PER_HOST. Caller holds the lock.
+    
+    Returns:
+        True if a new session may be opened
+    """
+    host_sessions = [
+        (session.last_used, key) for key, session in _pct_sessions.items()
+        if key[:2] == (ssh_user, host)
+    ]
+    if len(host_sessions) < _MAX_PCT_SESSIONS_PER_HOST:
+        return True
+    idle = [item for item in host_sessions if not _pct_sessions[item[1]].lock.locked()]
+    if not idle:
+        return False
+    _, key = min(idle)
+    _pct_sessions.pop(key).close()
+    return True
+
+
+@atexit.register
+def _close_all_sessions() -> None:
+    with _pct_sessions_lock:
+        _close_idle_sessions(max_idle=-1)
+
+
+class _AsyncSSHConnectError(Exception):
+    """No asyncssh connection could be made; the command was not started."""
+
+
+class _AsyncSSHPool:
+    """
+    asyncssh connections kept open on a background event loop.
+    
+    Each host command opens a channel on an existing connection instead of
+    spawning an ssh process. The loop runs in its own thread so sync callers,
+    including code already running inside another event loop, can use it.
+    """
+    
+    __slots__ = ("_loop", "_loop_lock", "_connect_lock", "_conns")
+    
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._conns: Dict[Tuple[str, str, str], Any] = {}
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="mcp-asyncssh", daemon=True
+                ).start()
+            return self._loop
+    
+    async def _connection(self, host: str, user: str, key: str):
+        # Created lazily so it belongs to the pool's loop
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            conn = self._conns.get((user, host, key))
+            if conn is None or conn.is_closed():
+                conn = await asyncssh.connect(
+                    host,
+                    username=user,
+                    client_keys=[key],
+                    known_hosts=None,
+                    connect_timeout=5
+                )
+                self._conns[(user, host, key)] = conn
+            return conn
+    
+    async def _run(self, host: str, user: str, key: str, command: str, timeout: float) -> Tuple[int, bytes, bytes]:
+        try:
+            conn = await self._connection(host, user, key)
+        except (OSError, ValueError, asyncssh.Error) as e:
+            raise _AsyncSSHConnectError(str(e)) from e
+        try:
+            result = await conn.run(command, timeout=timeout, encoding=None)
+        except asyncssh.TimeoutError:
+            return 124, b"", f"Command timed out after {timeout}s".encode()
+        except asyncssh.ChannelOpenError as e:
+            # Refused before the command started, so falling back is still safe
+            raise _AsyncSSHConnectError(str(e)) from e
+        except (OSError, asyncssh.Error) as e:
+            # The command may already have started, so it must not be retried
+            return 255, b"", f"SSH connection failed while running command: {e}".encode()
+        # exit_status is None when the command was killed by a signal
+        exit_code = result.exit_status if result.exit_status is not None else 255
+        return exit_code, result.stdout or b"", result.stderr or b""
+    
+    def run(self, host: str, user: str, key: str, command: str, timeout: float) -> Tuple[int, bytes, bytes]:
+        """
+        Run command on host over a pooled connection.
+        
+        Errors after the connection is up are returned as exit code 255,
+        since the command may already be running on the host.
+        
+        Raises:
+            _AsyncSSHConnectError: If no connection could be established, so
+                the command never started; its __cause__ is the original
+                error (a ValueError for keys that cannot be loaded)
+        
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(host, user, key, command, timeout), self._get_loop()
+        )
+        return future.result()
+    
+    async def _close_all(self) -> None:
+        conns, self._conns = list(self._conns.values()), {}
+        for conn in conns:
+            conn.close()
+        for conn in conns:
+            await conn.wait_closed()
+    
+    def close(self) -> None:
+        """Close all pooled connections and stop the background loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout=5)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_asyncssh_pool = _AsyncSSHPool()
+atexit.register(_asyncssh_pool.close)
+
 
 class ContainerOperations:
     """High-level container operations using SSH + pct commands"""
     
-    def __init__(self, proxmox_host: str, ssh_key: Optional[str] = None, ssh_user: str = "root"):
+    __slots__ = (
+        "proxmox_host", "ssh_user", "persistent_sessions", "use_asyncssh",
+        "ssh_key", "timeout", "control_path",
+    )
+    
+    def __init__(
+        self,
+        proxmox_host: str,
+        ssh_key: Optional[str] = None,
+        ssh_user: str = "root",
+        persistent_sessions: bool = True,
+        use_asyncssh: bool = True
+    ):
         """
         Initialize container operations.
         
@@ -25,29 +537,91 @@ class ContainerOperations:
             proxmox_host: Proxmox host IP or hostname
             ssh_key: Path to SSH key (default: ~/.ssh/id_openssh or id_rsa)
             ssh_user: SSH user (default: root)
+            persistent_sessions: Run exec_in_container commands through a
+                long-lived shell per container instead of one pct exec each
+            use_asyncssh: Run host commands over a pooled in-process asyncssh
+                connection when asyncssh is installed, instead of an ssh process
         """
         self.proxmox_host = proxmox_host
         self.ssh_user = ssh_user
+        self.persistent_sessions = persistent_sessions
+        self.use_asyncssh = use_asyncssh and asyncssh is not None
         
         # Find SSH key
-        if ssh_key:
-            self.ssh_key = ssh_key
-        else:
-            # Try common locations
-            for key_path in [
-                "~/.ssh/id_openclaw",
-                "~/.ssh/id_openssh", 
-                "~/.ssh/id_rsa",
-                "~/.ssh/id_ed25519"
-            ]:
-                expanded = os.path.expanduser(key_path)
-                if os.path.exists(expanded):
-                    self.ssh_key = expanded
-                    break
-            else:
-                raise ValueError("Could not find SSH key. Provide ssh_key parameter.")
+        self.ssh_key = ssh_key or _discover_ssh_key()
+        
+        self.timeout = DEFAULT_TIMEOUT
+        
+        # OpenSSH multiplexing: %C hashes (local host, remote host, port, user),
+        # so every instance in this process talking to the same host shares one master
+        self.control_path = os.path.join(_control_dir(), f"{os.getpid()}-%C")
+    
+    def _ssh_base_args(self) -> List[str]:
+        """Common ssh arguments (key, host checking, connect timeout, mux socket)."""
+        return [
+            "-i", self.ssh_key,
+            "-o", "StrictHostKeyChecking=no",
+            "-o", "ConnectTimeout=5",
+            "-o", f"ControlPath={self.control_path}",
+        ]
+    
+    def _ensure_master(self) -> None:
+        """
+        Start a background SSH master connection if one is not already running.
         
-        self.timeout = 30  # Default timeout for SSH commands
+        Commands attach to it with ControlMaster=no, so if the master cannot be
+        started they transparently fall back to a direct connection.
+        """
+        now = time.monotonic()
+        master_key = (self.ssh_user, self.proxmox_host)
+        last_used = _ssh_masters.get(master_key)
+        if last_used is not None and now - last_used < SSH_CONTROL_PERSIST:
+            _ssh_masters[master_key] = now
+            return
+        
+        target = f"{self.ssh_user}@{self.proxmox_host}"
+        try:
+            check = subprocess.run(
+                ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "check", target],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=5
+            )
+            if check.returncode != 0:
+                subprocess.run(
+                    ["ssh", *self._ssh_base_args(),
+                     "-o", "ControlMaster=yes",
+                     "-o", f"ControlPersist={SSH_CONTROL_PERSIST}s",
+                     "-M", "-N", "-f", target],
+                    stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    timeout=self.timeout
+                )
+            _ssh_masters[master_key] = now
+        except (subprocess.TimeoutExpired, OSError):
+            _ssh_masters.pop(master_key, None)
+    
+    def close(self) -> None:
+        """Tear down the shared SSH master connection for this host."""
+        _ssh_masters.pop((self.ssh_user, self.proxmox_host), None)
+        try:
+            subprocess.run(
+                ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "exit",
+                 f"{self.ssh_user}@{self.proxmox_host}"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=5
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            pass
+    
+    def _ssh_command_args(self, command: str) -> List[str]:
+        """Build the ssh argv that runs command on the Proxmox host via the shared master."""
+        self._ensure_master()
+        return [
+            "ssh",
+            *self._ssh_base_args(),
+            "-o", "ControlMaster=no",
+            f"{self.ssh_user}@{self.proxmox_host}",
+            command
+        ]
     
     def _run_ssh_command(self, command: str, timeout: int = None) -> Tuple[int, str, str]:
         """
@@ -57,47 +631,191 @@ class ContainerOperations:
             command: Command to execute
             timeout: Command timeout in seconds
         
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        exit_code, stdout, stderr = self._run_ssh_command_bytes(command, timeout)
+        return exit_code, stdout.decode('utf-8', 'replace'), stderr.decode('utf-8', 'replace')
+    
+    def _run_ssh_command_bytes(self, command: str, timeout: int = None) -> Tuple[int, bytes, bytes]:
+        """
+        Execute command on Proxmox host via SSH, returning raw output.
+        
+        Output is captured as bytes and never decoded, for callers handling
+        large or binary data.
+        
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
         if timeout is None:
             timeout = self.timeout
         
-        full_cmd = [
-            "ssh",
-            "-i", self.ssh_key,
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "ConnectTimeout=5",
-            f"{self.ssh_user}@{self.proxmox_host}",
-            command
-        ]
+        if self.use_asyncssh:
+            try:
+                return _asyncssh_pool.run(
+                    self.proxmox_host, self.ssh_user, self.ssh_key, command, timeout
+                )
+            except _AsyncSSHConnectError as e:
+                # The command never started, so the ssh binary can run it instead.
+                # Only a key asyncssh cannot load is permanent; retry asyncssh
+                # next time after anything else (host down, auth hiccup).
+                if isinstance(e.__cause__, ValueError):
+                    self.use_asyncssh = False
         
         try:
             result = subprocess.run(
-                full_cmd,
+                self._ssh_command_args(command),
                 capture_output=True,
-                text=True,
                 timeout=timeout
             )
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
-            return 124, "", f"Command timed out after {timeout}s"
+            return 124, b"", f"Command timed out after {timeout}s".encode()
+        except Exception as e:
+            return 1, b"", str(e).encode()
+    
+    def _run_ssh_command_stdin(
+        self,
+        command: str,
+        stdin_chunks: Iterable[bytes],
+        timeout: int = None
+    ) -> Tuple[int, str, str]:
+        """
+        Execute command on Proxmox host via SSH, streaming stdin_chunks to its stdin.
+        
+        Chunks are written from a separate thread as they are produced, so the
+        full payload never has to be held in memory.
+        
+        Args:
+            command: Command to execute
+            stdin_chunks: Iterable of bytes written to the remote command's stdin
+            timeout: Command timeout in seconds
+        
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        if timeout is None:
+            timeout = self.timeout
+        
+        try:
+            proc = subprocess.Popen(
+                self._ssh_command_args(command),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
         except Exception as e:
             return 1, "", str(e)
+        
+        # Fed by the writer thread; detached so communicate() leaves it alone
+        stdin, proc.stdin = proc.stdin, None
+        
+        def feed() -> None:
+            try:
+                for chunk in stdin_chunks:
+                    stdin.write(chunk)
+            except (BrokenPipeError, ValueError):
+                pass  # remote side exited early; its status is reported below
+            finally:
+                try:
+                    stdin.close()
+                except BrokenPipeError:
+                    pass
+        
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return 124, "", f"Command timed out after {timeout}s"
+        finally:
+            writer.join()
+        
+        return (
+            proc.returncode,
+            stdout.decode('utf-8', 'replace'),
+            stderr.decode('utf-8', 'replace'),
+        )
+    
+    def _run_in_session(self, vmid: int, command: str, timeout: int = None) -> Optional[Tuple[int, str, str]]:
+        """
+        Run command through the persistent shell for vmid, starting it if needed.
+        
+        Returns:
+            Tuple of (exit_code, stdout, stderr), or None if the session could
+            not take the command (the caller should fall back to pct exec)
+        """
+        if timeout is None:
+            timeout = self.timeout
+        
+        key = (self.ssh_user, self.proxmox_host, vmid)
+        with _pct_sessions_lock:
+            _close_idle_sessions()
+            session = _pct_sessions.get(key)
+            if session is not None and not session.alive():
+                del _pct_sessions[key]
+                session.close()
+                session = None
+        
+        if session is None:
+            # Starting the session may first open the ssh master, so it runs
+            # outside the lock; if another thread won the race, use its session
+            try:
+                started = _PctSession(self._ssh_command_args(f"pct exec {vmid} -- sh"))
+            except OSError:
+                return None
+            with _pct_sessions_lock:
+                session = _pct_sessions.get(key)
+                if session is None or not session.alive():
+                    if session is not None:
+                        del _pct_sessions[key]
+                        session.close()
+                    if _evict_lru_session(self.ssh_user, self.proxmox_host):
+                        _pct_sessions[key] = session = started
+                        started = None
+                    else:
+                        session = None
+            if started is not None:
+                started.close()
+            if session is None:
+                return None
+        
+        with session.lock:
+            try:
+                return session.run(command, timeout)
+            except (BrokenPipeError, ValueError):
+                with _pct_sessions_lock:
+                    if _pct_sessions.get(key) is session:
+                        del _pct_sessions[key]
+                session.close()
+                return None
     
     def exec_in_container(
         self, 
         vmid: int, 
-        command: str,
-        timeout: int = None
+        command: Union[str, List[str]],
+        timeout: int = None,
+        tail_lines: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Execute command inside LXC container.
         
+        A string command is parsed by a shell, so pipes, ``&&`` and
+        redirections work. A list is an argv that is quoted with
+        ``shlex.join`` and run as-is, so its arguments need no escaping.
+        
+        With tail_lines set, the command's stdout and stderr are spooled to
+        temp files inside the container and only their last tail_lines lines
+        are sent back, so chatty commands (apt-get, pip install) do not ship
+        megabytes of progress output over SSH.
+        
         Args:
             vmid: Container ID
-            command: Command to execute
+            command: Shell command string, or argv list
             timeout: Command timeout in seconds (default: 30)
+            tail_lines: Only return the last N lines of stdout and stderr
         
         Returns:
             Dict with keys:
@@ -106,10 +824,20 @@ class ContainerOperations:
                 - error: str (stderr)
                 - exit_code: int
         """
-        # Escape command for pct exec
-        escaped_cmd = f'pct exec {vmid} -- {command}'
+        if not isinstance(command, str):
+            command = shlex.join(command)
+        if tail_lines is not None:
+            command = shlex.join(["sh", "-c", _TAIL_SCRIPT.format(command=command, lines=int(tail_lines))])
         
-        exit_code, stdout, stderr = self._run_ssh_command(escaped_cmd, timeout)
+        session_result = self._run_in_session(vmid, command, timeout) if self.persistent_sessions else None
+        if session_result is not None:
+            exit_code, stdout, stderr = session_result
+        else:
+            # Same container-side sh -c as the session path, so the host shell
+            # never parses the command's pipes, && or redirections
+            escaped_cmd = f'pct exec {vmid} -- {_container_shell(command)}'
+            
+            exit_code, stdout, stderr = self._run_ssh_command(escaped_cmd, timeout)
         
         return {
             "success": exit_code == 0,
@@ -118,6 +846,129 @@ class ContainerOperations:
             "exit_code": exit_code
         }
     
+    async def exec_in_containers(
+        self,
+        vmids: List[int],
+        command: Union[str, List[str]],
+        timeout: int = None,
+        max_concurrency: int = SSH_MAX_SESSIONS // 2
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Execute the same command in several containers concurrently.
+        
+        Each call runs exec_in_container in a worker thread; all of them share
+        the SSH master connection, and at most max_concurrency run at once.
+        The default keeps the channels in use under sshd's MaxSessions.
+        
+        Args:
+            vmids: Container IDs
+            command: Shell command string, or argv list
+            timeout: Per-container command timeout in seconds (default: 30)
+            max_concurrency: Maximum number of containers in flight
+        
+        Returns:
+            Dict mapping each vmid to its exec_in_container result
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(vmid: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self.exec_in_container, vmid, command, timeout)
+        
+        results = await asyncio.gather(*(run_one(vmid) for vmid in vmids))
+        return dict(zip(vmids, results))
+    
+    def _run_scp(self, source: str, destination: str, timeout: int = None) -> Tuple[int, str, str]:
+        """
+        Copy a file between this machine and the Proxmox host with scp.
+        
+        Remote paths use the ``user@host:path`` form. The transfer reuses the
+        shared SSH master connection when one is running.
+        
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        if timeout is None:
+            timeout = self.timeout
+        
+        self._ensure_master()
+        full_cmd = [
+            "scp", "-q",
+            *self._ssh_base_args(),
+            "-o", "ControlMaster=no",
+            source,
+            destination
+        ]
+        
+        try:
+            result = subprocess.run(
+                full_cmd,
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            return result.returncode, result.stdout, result.stderr
+        except subprocess.TimeoutExpired:
+            return 124, "", f"Command timed out after {timeout}s"
+        except Exception as e:
+            return 1, "", str(e)
+    
+    def _host_temp_path(self) -> str:
+        """Return a unique scratch path on the Proxmox host."""
+        return f"/tmp/mcp-transfer-{uuid.uuid4().hex}"
+    
+    def _push_via_pct(self, vmid: int, local_path: str, remote_path: str) -> Dict[str, Any]:
+        """Push a file with scp to the host followed by ``pct push`` (no encoding).
+        
+        The destination directory is created in the same remote command.
+        """
+        host_tmp = self._host_temp_path()
+        exit_code, _, stderr = self._run_scp(
+            local_path, f"{self.ssh_user}@{self.proxmox_host}:{host_tmp}"
+        )
+        if exit_code != 0:
+            return {"success": False, "error": stderr.strip() or None}
+        
+        tmp = shlex.quote(host_tmp)
+        remote_dir = shlex.quote(posixpath.dirname(remote_path) or ".")
+        exit_code, _, stderr = self._run_ssh_command(
+            f"pct exec {vmid} -- mkdir -p {remote_dir} && pct push {vmid} {tmp} {shlex.quote(remote_path)}; "
+            f"rc=$?; rm -f {tmp}; exit $rc"
+        )
+        return {"success": exit_code == 0, "error": stderr.strip() or None}
+    
+    def _push_via_base64(self, vmid: int, local_path: str, remote_path: str) -> Dict[str, Any]:
+        """Push a file by streaming it base64-encoded over ssh stdin.
+        
+        The destination directory is created in the same remote command.
+        """
+        remote_dir = shlex.quote(posixpath.dirname(remote_path) or ".")
+        dest = shlex.quote(remote_path)
+        
+        if zstandard is not None:
+            # Compress before encoding to cut the bytes sent over SSH; exit 127
+            # means the container has no zstd, so retry uncompressed
+            decode_cmd = (
+                f"command -v zstd >/dev/null || exit 127; "
+                f"mkdir -p {remote_dir} && base64 -d | zstd -dq > {dest}"
+            )
+            with open(local_path, 'rb') as f:
+                exit_code, _, stderr = self._run_ssh_command_stdin(
+                    f"pct exec {vmid} -- sh -c {shlex.quote(decode_cmd)}",
+                    _iter_base64(f, compress=True)
+                )
+            if exit_code != 127:
+                return {"success": exit_code == 0, "error": stderr.strip() or None}
+        
+        # Stream the payload over stdin and decode it in the container in one pass
+        decode_cmd = f"mkdir -p {remote_dir} && base64 -d > {dest}"
+        with open(local_path, 'rb') as f:
+            exit_code, _, stderr = self._run_ssh_command_stdin(
+                f"pct exec {vmid} -- sh -c {shlex.quote(decode_cmd)}",
+                _iter_base64(f)
+            )
+        return {"success": exit_code == 0, "error": stderr.strip() or None}
+    
     def push_file_to_container(
         self,
         vmid: int,
@@ -125,7 +976,11 @@ class ContainerOperations:
         remote_path: str
     ) -> Dict[str, Any]:
         """
-        Copy file from host into container using base64 encoding.
+        Copy file from host into container.
+        
+        Uses scp + ``pct push`` so no encoding is needed, and falls back to
+        streaming the file base64-encoded over SSH if that fails. The
+        destination directory is created if needed.
         
         Args:
             vmid: Container ID
@@ -139,56 +994,120 @@ class ContainerOperations:
                 - file_size: int (bytes)
         """
         try:
-            # Read local file
-            with open(local_path, 'rb') as f:
-                file_data = f.read()
-            
-            file_size = len(file_data)
-            
-            # Base64 encode
-            b64_data = base64.b64encode(file_data).decode('utf-8')
+            file_size = os.path.getsize(local_path)
             
-            # Create directory if needed
-            remote_dir = remote_path.rsplit('/', 1)[0]
-            self.exec_in_container(vmid, f"mkdir -p {remote_dir}")
-            
-            # Decode in container using base64
-            # Split into chunks to avoid shell line length limits
-            chunk_size = 500  # Characters per chunk
-            chunks = [b64_data[i:i+chunk_size] for i in range(0, len(b64_data), chunk_size)]
-            
-            # Build command to write file
-            decode_cmd = f"echo '{chunks[0]}' | base64 -d > {remote_path}"
-            for chunk in chunks[1:]:
-                decode_cmd += f" && echo '{chunk}' | base64 -d >> {remote_path}"
-            
-            result = self.exec_in_container(vmid, decode_cmd)
+            result = self._push_via_pct(vmid, local_path, remote_path)
+            if not result['success']:
+                result = self._push_via_base64(vmid, local_path, remote_path)
             
             if result['success']:
-                return {
-                    "success": True,
-                    "message": f"File pushed successfully to {remote_path}",
-                    "file_size": file_size
-                }
+                return _transfer_result(True, f"File pushed successfully to {remote_path}", file_size)
             else:
-                return {
-                    "success": False,
-                    "message": f"Failed to push file: {result['error']}",
-                    "file_size": 0
-                }
+                return _transfer_result(False, f"Failed to push file: {result['error']}")
         
         except FileNotFoundError:
-            return {
-                "success": False,
-                "message": f"Local file not found: {local_path}",
-                "file_size": 0
-            }
+            return _transfer_result(False, f"Local file not found: {local_path}")
         except Exception as e:
-            return {
-                "success": False,
-                "message": f"Error pushing file: {str(e)}",
-                "file_size": 0
-            }
+            return _transfer_result(False, f"Error pushing file: {str(e)}")
+    
+    def write_file_to_container(
+        self,
+        vmid: int,
+        content: Union[str, bytes],
+        remote_path: str
+    ) -> Dict[str, Any]:
+        """
+        Write content to a file inside the container.
+        
+        The raw bytes are streamed over SSH stdin straight into ``cat`` in the
+        container, so nothing is encoded, staged on the host or passed through
+        a shell command line. The destination directory is created if needed.
+        
+        Args:
+            vmid: Container ID
+            content: File content (str is written as UTF-8)
+            remote_path: Destination path in container
+        
+        Returns:
+            Dict with keys:
+                - success: bool
+                - message: str
+                - file_size: int (bytes)
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        remote_dir = posixpath.dirname(remote_path) or "."
+        write_cmd = f"mkdir -p {shlex.quote(remote_dir)} && cat > {shlex.quote(remote_path)}"
+        exit_code, _, stderr = self._run_ssh_command_stdin(
+            f"pct exec {vmid} -- sh -c {shlex.quote(write_cmd)}",
+            [content]
+        )
+        
+        if exit_code == 0:
+            return _transfer_result(True, f"File written successfully to {remote_path}", len(content))
+        return _transfer_result(False, f"Failed to write file: {stderr.strip() or None}")
+    
+    def _pull_via_pct(self, vmid: int, remote_path: str, local_path: str) -> Dict[str, Any]:
+        """Pull a file with ``pct pull`` to the host followed by scp (no encoding)."""
+        host_tmp = self._host_temp_path()
+        tmp = shlex.quote(host_tmp)
+        exit_code, _, stderr = self._run_ssh_command(
+            f"pct pull {vmid} {shlex.quote(remote_path)} {tmp}"
+        )
+        if exit_code != 0:
+            self._run_ssh_command(f"rm -f {tmp}")
+            return {"success": False, "error": stderr.strip() or None}
+        
+        exit_code, _, stderr = self._run_scp(
+            f"{self.ssh_user}@{self.proxmox_host}:{host_tmp}", local_path
+        )
+        self._run_ssh_command(f"rm -f {tmp}")
+        return {"success": exit_code == 0, "error": stderr.strip() or None}
+    
+    def _pull_via_base64(self, vmid: int, remote_path: str, local_path: str) -> Dict[str, Any]:
+        """Pull a file by base64-encoding it in the container and decoding here.
+        
+        When zstandard is installed and the container has zstd, the file is
+        compressed before encoding and the output is tagged with _ZSTD_TAG.
+        """
+        encode_cmd = ["base64", "-w0", remote_path]
+        if zstandard is not None:
+            src = shlex.quote(remote_path)
+            encode_cmd = [
+                "sh", "-c",
+                f"if command -v zstd >/dev/null 2>&1; then "
+                f"printf {_ZSTD_TAG}; zstd -qc -- {src} | base64 -w0; "
+                f"else base64 -w0 {src}; fi"
+            ]
+        # Raw bytes straight from ssh: the payload is ASCII, so skip the utf-8 decode
+        exit_code, output, stderr = self._run_ssh_command_bytes(
+            f"pct exec {vmid} -- {shlex.join(encode_cmd)}"
+        )
+        if exit_code != 0:
+            return {"success": False, "error": stderr.decode('utf-8', 'replace').strip() or None}
+        
+        # Decode on host in fixed windows (a multiple of 4 characters) so the
+        # whole decoded file is never held in memory; validate=True rejects
+        # truncated or corrupted output
+        output = output.strip()
+        start = len(_ZSTD_TAG) if output.startswith(_ZSTD_TAG.encode()) else 0
+        decompressor = zstandard.ZstdDecompressor().decompressobj() if start else None
+        step = _STREAM_WINDOW // 3 * 4
+        try:
+            with open(local_path, 'wb') as f:
+                for i in range(start, len(output), step):
+                    chunk = b64.b64decode(output[i:i + step], validate=True)
+                    if decompressor is not None:
+                        chunk = decompressor.decompress(chunk)
+                    f.write(chunk)
+            if decompressor is not None and not decompressor.eof:
+                raise ValueError("truncated zstd stream")
+        except _PULL_DECODE_ERRORS as e:
+            os.remove(local_path)
+            return {"success": False, "error": f"Invalid transfer data for {remote_path}: {e}"}
+        
+        return {"success": True, "error": None}
     
     def pull_file_from_container(
         self,
@@ -197,7 +1116,10 @@ class ContainerOperations:
         local_path: str
     ) -> Dict[str, Any]:
         """
-        Copy file from container to host using base64 encoding.
+        Copy file from container to host.
+        
+        Uses ``pct pull`` + scp so no encoding is needed, and falls back to
+        base64-encoding the file over SSH if that fails.
         
         Args:
             vmid: Container ID
@@ -212,44 +1134,23 @@ class ContainerOperations:
         """
         try:
             # Check if file exists in container
-            check_result = self.exec_in_container(vmid, f"test -f {remote_path} && echo OK")
+            check_result = self.exec_in_container(vmid, ["test", "-f", remote_path])
             if not check_result['success']:
-                return {
-                    "success": False,
-                    "message": f"File not found in container: {remote_path}",
-                    "file_size": 0
-                }
+                return _transfer_result(False, f"File not found in container: {remote_path}")
             
-            # Base64 encode in container and retrieve
-            encode_result = self.exec_in_container(vmid, f"base64 -w0 {remote_path}")
-            if not encode_result['success']:
-                return {
-                    "success": False,
-                    "message": f"Failed to read file: {encode_result['error']}",
-                    "file_size": 0
-                }
+            os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
             
-            # Decode on host
-            b64_data = encode_result['output']
-            file_data = base64.b64decode(b64_data)
+            result = self._pull_via_pct(vmid, remote_path, local_path)
+            if not result['success']:
+                result = self._pull_via_base64(vmid, remote_path, local_path)
             
-            # Write to local path
-            os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
-            with open(local_path, 'wb') as f:
-                f.write(file_data)
+            if not result['success']:
+                return _transfer_result(False, f"Failed to read file: {result['error']}")
             
-            return {
-                "success": True,
-                "message": f"File pulled successfully to {local_path}",
-                "file_size": len(file_data)
-            }
+            return _transfer_result(True, f"File pulled successfully to {local_path}", os.path.getsize(local_path))
         
         except Exception as e:
-            return {
-                "success": False,
-                "message": f"Error pulling file: {str(e)}",
-                "file_size": 0
-            }
+            return _transfer_result(False, f"Error pulling file: {str(e)}")
     
     def check_container_network(
         self,
@@ -271,30 +1172,15 @@ class ContainerOperations:
                 - latency_ms: float (round-trip time in milliseconds, or None)
                 - error: str (error message if failed)
         """
-        ping_cmd = f"ping -c 1 -W {timeout} {test_ip}"
-        result = self.exec_in_container(vmid, ping_cmd, timeout=timeout + 5)
+        ping_cmd = ["ping", "-c", "1", "-W", str(timeout), test_ip]
+        result = self.exec_in_container(vmid, ping_cmd, timeout=timeout + 3)
         
         if result['success']:
-            # Parse latency from ping output
-            output = result['output']
-            try:
-                # Look for "time=X.XX ms" in output
-                for line in output.split('\n'):
-                    if 'time=' in line:
-                        time_part = line.split('time=')[1].split(' ')[0]
-                        latency = float(time_part)
-                        return {
-                            "online": True,
-                            "latency_ms": latency,
-                            "error": None
-                        }
-            except (IndexError, ValueError):
-                pass
-            
-            # If we can't parse, but ping succeeded
+            # Parse latency ("time=X.XX ms") from ping output; None if absent
+            match = _PING_TIME_RE.search(result['output'])
             return {
                 "online": True,
-                "latency_ms": None,
+                "latency_ms": float(match.group(1)) if match else None,
                 "error": None
             }
         else:
@@ -317,29 +1203,82 @@ class ContainerOperations:
             key: Optional specific key to retrieve
         
         Returns:
-            Dict with container configuration
+            Dict with container configuration: raw hostname, network and
+            resources text plus parsed ip, mem_total, mem_used and
+            disk_used_pct (None where not found)
         """
-        result = self.exec_in_container(vmid, "cat /etc/hostname")
-        hostname = result['output'] if result['success'] else "unknown"
-        
-        # Get network info
-        net_result = self.exec_in_container(vmid, "ip addr show")
+        # Hostname, network and resource info in one round trip; each section
+        # is followed by a marker line carrying its exit status
+        result = self.exec_in_container(vmid, ["sh", "-c", _CONFIG_SCRIPT])
+        sections = _split_config_output(result['output']) if result['success'] else {}
         
-        # Get resource info
-        res_result = self.exec_in_container(vmid, "free -h && df -h /")
+        hostname, host_ok = sections.get("hostname", ("unknown", False))
+        network, net_ok = sections.get("network", (None, False))
+        resources, res_ok = sections.get("resources", (None, False))
         
         config = {
             "vmid": vmid,
-            "hostname": hostname.strip(),
-            "network": net_result['output'] if net_result['success'] else None,
-            "resources": res_result['output'] if res_result['success'] else None
+            "hostname": hostname.strip() if host_ok else "unknown",
+            "network": network if net_ok else None,
+            "resources": resources if res_ok else None
         }
+        config.update(_parse_config_fields(config["network"], config["resources"]))
         
         if key:
             return config.get(key)
         
         return config
     
+    def get_service_status(
+        self,
+        vmid: int,
+        service: str,
+        log_lines: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Get a systemd service's state, PID, uptime and recent logs.
+        
+        All four probes run in one exec, separated by marker lines.
+        
+        Args:
+            vmid: Container ID
+            service: systemd unit name (e.g. "nginx")
+            log_lines: Number of journal lines to include
+        
+        Returns:
+            Dict with keys:
+                - active: bool (True if systemctl is-active reports "active")
+                - state: str (is-active output, e.g. "active", "failed")
+                - pid: int (main PID, 0 if not running)
+                - uptime_seconds: int (0 if not running)
+                - status: str (systemctl status output)
+                - logs: str (last log_lines journal lines)
+        """
+        logs_marker, pid_marker, uptime_marker, active_marker = _SERVICE_MARKERS
+        unit = shlex.quote(service)
+        script = (
+            f"pid=$(systemctl show -p MainPID --value {unit}); "
+            f"systemctl status {unit} --no-pager 2>&1; "
+            f"echo {logs_marker}; journalctl -u {unit} -n {int(log_lines)} --no-pager 2>&1; "
+            f"echo {pid_marker}; echo \"$pid\"; "
+            f"echo {uptime_marker}; ps -o etimes= -p \"$pid\" 2>/dev/null || echo 0; "
+            f"echo {active_marker}; systemctl is-active {unit}; true"
+        )
+        result = self.exec_in_container(vmid, ["sh", "-c", script])
+        sections = _parse_delimited(result['output'], _SERVICE_MARKERS)
+        
+        pid = sections.get(pid_marker, "")
+        uptime = sections.get(uptime_marker, "")
+        state = sections.get(active_marker, "unknown") or "unknown"
+        return {
+            "active": state == "active",
+            "state": state,
+            "pid": int(pid) if pid.isdigit() else 0,
+            "uptime_seconds": int(uptime) if uptime.isdigit() and pid not in ("", "0") else 0,
+            "status": sections.get("", ""),
+            "logs": sections.get(logs_marker, "")
+        }
+    
     def wait_for_container_network(
         self,
         vmid: int,
@@ -350,10 +1289,14 @@ class ContainerOperations:
         """
         Wait for container network to come online.
         
+        Probes back off exponentially (0.2s, 0.4s, 0.8s, ... capped at
+        retry_delay), so readiness is detected soon after it happens. The
+        overall wait budget is unchanged: max_retries * retry_delay seconds.
+        
         Args:
             vmid: Container ID
-            max_retries: Maximum number of retry attempts
-            retry_delay: Delay between retries in seconds
+            max_retries: Maximum number of retry attempts at the full retry_delay cadence
+            retry_delay: Maximum delay between retries in seconds
             test_ip: IP to test
         
         Returns:
@@ -363,28 +1306,32 @@ class ContainerOperations:
                 - total_wait_ms: float
                 - error: str (if failed)
         """
-        import time
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + max_retries * retry_delay
+        attempt = 0
         
-        for attempt in range(max_retries):
-            net_check = self.check_container_network(vmid, test_ip)
+        while True:
+            attempt += 1
+            net_check = self.check_container_network(vmid, test_ip, timeout=NETWORK_PROBE_TIMEOUT)
             
             if net_check['online']:
-                elapsed = (time.time() - start_time) * 1000
+                elapsed = (time.monotonic() - start_time) * 1000
                 return {
                     "online": True,
-                    "attempts": attempt + 1,
+                    "attempts": attempt,
                     "total_wait_ms": elapsed,
                     "error": None
                 }
             
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+            delay = min(retry_delay, 0.2 * (2 ** (attempt - 1)))
+            if time.monotonic() + delay >= deadline:
+                break
+            time.sleep(delay)
         
-        elapsed = (time.time() - start_time) * 1000
+        elapsed = (time.monotonic() - start_time) * 1000
         return {
             "online": False,
-            "attempts": max_retries,
+            "attempts": attempt,
             "total_wait_ms": elapsed,
-            "error": f"Network did not come online after {max_retries} retries"
+            "error": f"Network did not come online after {attempt} attempts"
         }
@@ -145,15 +145,21 @@ class DockerSwarmConfig:
         return """#!/bin/bash
 set -euo pipefail
 
-# Update package index
-apt-get update
-
-# Install prerequisites
-apt-get install -y \\
-    ca-certificates \\
-    curl \\
-    gnupg \\
-    lsb-release
+export DEBIAN_FRONTEND=noninteractive
+APT_OPTS="-o Acquire::Languages=none -o Dpkg::Use-Pty=0"
+
+# Update package index unless it was refreshed within the last hour
+if ! ls /var/lib/apt/lists/*_Packages >/dev/null 2>&1 || \\
+   [ -z "$(find /var/lib/apt/lists -maxdepth 0 -mmin -60)" ]; then
+    apt-get $APT_OPTS update
+fi
+
+# Install prerequisites, unless dpkg already reports all of them installed
+PREREQS="ca-certificates curl gnupg lsb-release"
+missing=$(dpkg-query -W -f='${Status}\\n' $PREREQS 2>&1 | grep -cv '^install ok installed$' || true)
+if [ "$missing" -gt 0 ]; then
+    apt-get $APT_OPTS install -y --no-install-recommends $PREREQS
+fi
 
 # Add Docker's official GPG key
 mkdir -p /etc/apt/keyrings
@@ -164,15 +170,17 @@ echo \\
   "deb [arch=$(dpkg --print-architecture) signed-by=/etc/apt/keyrings/docker.gpg] https://download.docker.com/linux/ubuntu \\
   $(lsb_release -cs) stable" | tee /etc/apt/sources.list.d/docker.list > /dev/null
 
-# Update package index with new repository
-apt-get update
+# Fetch only the new repository's index; the others are already current
+apt-get $APT_OPTS update \\
+    -o Dir::Etc::sourcelist=sources.list.d/docker.list \\
+    -o Dir::Etc::sourceparts=- \\
+    -o APT::Get::List-Cleanup=0
 
 # Install Docker Engine
-apt-get install -y docker-ce docker-ce-cli containerd.io docker-buildx-plugin docker-compose-plugin
+apt-get $APT_OPTS install -y docker-ce docker-ce-cli containerd.io docker-buildx-plugin docker-compose-plugin
 
-# Start and enable Docker
-systemctl start docker
-systemctl enable docker
+# Enable and start Docker
+systemctl enable --now docker
 
 # Add current user to docker group
 usermod -aG docker $USER
@@ -219,9 +227,8 @@ dnf config-manager --add-repo https://download.docker.com/linux/centos/docker-ce
 # Install Docker Engine
 dnf install -y docker-ce docker-ce-cli containerd.io docker-buildx-plugin docker-compose-plugin
 
-# Start and enable Docker
-systemctl start docker
-systemctl enable docker
+# Enable and start Docker
+systemctl enable --now docker
 
 # Add current user to docker group
 usermod -aG docker $USER
@@ -7,14 +7,60 @@ based on cluster selection strategy while maintaining transparent API compatibil
 
 from __future__ import annotations
 
+import copy
+import inspect
 import logging
-from typing import Optional, Any, Dict, List
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional, Any, Dict, List, Tuple
 
 from .client import ProxmoxClient
 from .cluster_manager import ClusterRegistry, get_cluster_registry
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on remembered cluster selections before the cache is reset
+_CLUSTER_CACHE_SIZE = 1024
+
+# Seconds a read-only discovery result is reused before the API is asked again
+READ_CACHE_TTL = 5.0
+# Upper bound on cached read results per cluster before that cluster's cache is reset
+_READ_CACHE_SIZE = 512
+
+
+def _delegate(method: str, doc: str, write: bool = False):
+    """
+    Build a MultiClusterProxmoxClient method that forwards to the same-named
+    ProxmoxClient method on the selected cluster.
+    
+    The generated method has the ProxmoxClient method's signature with a
+    trailing ``cluster`` parameter, which may be passed positionally or by
+    keyword. Write methods drop the cluster's cached reads first.
+    """
+    signature = inspect.signature(getattr(ProxmoxClient, method))
+    signature = signature.replace(parameters=[
+        *signature.parameters.values(),
+        inspect.Parameter(
+            "cluster",
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=None,
+            annotation="Optional[str]",
+        ),
+    ])
+    
+    def forward(self, *args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(self, *args, **kwargs)
+        cluster = bound.arguments.pop("cluster", None)
+        get_client = self._get_write_client if write else self._get_client
+        # bound.args[0] is this wrapper's self
+        return getattr(get_client(cluster=cluster), method)(*bound.args[1:], **bound.kwargs)
+    
+    forward.__name__ = forward.__qualname__ = method
+    forward.__doc__ = doc
+    forward.__signature__ = signature
+    return forward
+
 
 class MultiClusterProxmoxClient:
     """
@@ -29,16 +75,59 @@ class MultiClusterProxmoxClient:
     3. Default cluster
     """
     
-    def __init__(self, registry: Optional[ClusterRegistry] = None):
+    __slots__ = (
+        "_registry",
+        "_cluster_cache",
+        "_read_cache",
+        "_read_cache_ttl",
+        "_inflight",
+        "_write_generation",
+        "_read_lock",
+    )
+    
+    def __init__(self, registry: Optional[ClusterRegistry] = None, read_cache_ttl: float = READ_CACHE_TTL):
         """
         Initialize multi-cluster client.
         
         Args:
             registry: ClusterRegistry instance. If None, uses global registry.
+            read_cache_ttl: Seconds to reuse read-only discovery results
+                (list_nodes, vm_config, ...). 0 disables the cache. Callers
+                get their own copy of a cached result, so they may modify it.
         """
         self._registry = registry or get_cluster_registry()
+        # Resolved cluster name per (cluster, resource_name); the registry's
+        # patterns are fixed at load time, so a selection never goes stale
+        self._cluster_cache: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        # Per cluster: (method, args) -> (expiry, result); dropped on any write
+        self._read_cache: Dict[str, Dict[Tuple, Tuple[float, Any]]] = {}
+        self._read_cache_ttl = read_cache_ttl
+        # Reads currently being fetched, so concurrent identical reads share one request
+        self._inflight: Dict[Tuple, Future] = {}
+        # Per cluster: bumped by every write, so reads that started before it are not cached
+        self._write_generation: Dict[str, int] = {}
+        self._read_lock = threading.Lock()
         logger.info(f"Initialized MultiClusterProxmoxClient with {len(self._registry.list_clusters())} cluster(s)")
     
+    def _select_cluster(
+        self,
+        cluster: Optional[str] = None,
+        resource_name: Optional[str] = None,
+    ) -> str:
+        """Resolve the cluster name for an operation (memoized)."""
+        key = (cluster, resource_name)
+        try:
+            selected_cluster = self._cluster_cache[key]
+        except KeyError:
+            selected_cluster = self._registry.select_cluster(
+                cluster_name=cluster,
+                resource_name=resource_name,
+            )
+            if len(self._cluster_cache) >= _CLUSTER_CACHE_SIZE:
+                self._cluster_cache.clear()
+            self._cluster_cache[key] = selected_cluster
+        return selected_cluster
+    
     def _get_client(
         self,
         cluster: Optional[str] = None,
@@ -54,45 +143,87 @@ class MultiClusterProxmoxClient:
         Returns:
             ProxmoxClient instance
         """
-        selected_cluster = self._registry.select_cluster(
-            cluster_name=cluster,
-            resource_name=resource_name,
-        )
+        # The client itself is not cached here so the registry's TTL still applies
+        return self._registry.get_client(self._select_cluster(cluster, resource_name))
+    
+    def _get_write_client(
+        self,
+        cluster: Optional[str] = None,
+        resource_name: Optional[str] = None,
+    ) -> ProxmoxClient:
+        """Like _get_client, but first drops the cluster's cached read results."""
+        selected_cluster = self._select_cluster(cluster, resource_name)
+        with self._read_lock:
+            self._read_cache.pop(selected_cluster, None)
+            self._write_generation[selected_cluster] = self._write_generation.get(selected_cluster, 0) + 1
         return self._registry.get_client(selected_cluster)
     
+    def _cached_read(self, cluster: Optional[str], method: str, *args: Any) -> Any:
+        """
+        Call a read-only ProxmoxClient method, reusing a result younger than
+        the read cache TTL. Exceptions are not cached.
+        
+        If the same read is already in flight on another thread, its result
+        (or exception) is awaited instead of issuing a second request.
+        
+        The cache keeps a private copy of each result and hands out deep
+        copies, so callers may modify what they get back. A result fetched
+        while a write to the cluster went through is returned but not cached.
+        """
+        selected_cluster = self._select_cluster(cluster)
+        if self._read_cache_ttl <= 0:
+            return getattr(self._registry.get_client(selected_cluster), method)(*args)
+        
+        key = (method, args)
+        with self._read_lock:
+            entry = self._read_cache.get(selected_cluster, {}).get(key)
+            fresh = entry is not None and entry[0] > time.monotonic()
+            if not fresh:
+                generation = self._write_generation.get(selected_cluster, 0)
+                # Keyed by generation so a read issued after a write never joins one from before it
+                flight_key = (selected_cluster, generation, method, args)
+                future = self._inflight.get(flight_key)
+                leader = future is None
+                if leader:
+                    future = self._inflight[flight_key] = Future()
+        
+        if fresh:
+            return copy.deepcopy(entry[1])
+        if not leader:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = getattr(self._registry.get_client(selected_cluster), method)(*args)
+        except BaseException as e:
+            with self._read_lock:
+                del self._inflight[flight_key]
+            future.set_exception(e)
+            raise
+        
+        # The leader keeps the original; the cache and any waiters share a private copy
+        stored = copy.deepcopy(result)
+        with self._read_lock:
+            if self._write_generation.get(selected_cluster, 0) == generation:
+                entries = self._read_cache.setdefault(selected_cluster, {})
+                if len(entries) >= _READ_CACHE_SIZE:
+                    entries.clear()
+                entries[key] = (time.monotonic() + self._read_cache_ttl, stored)
+            del self._inflight[flight_key]
+        future.set_result(stored)
+        return result
+    
     # -------- Discovery Methods --------
     
     def list_nodes(self, cluster: Optional[str] = None) -> List[Dict[str, Any]]:
         """List nodes from cluster."""
-        client = self._get_client(cluster=cluster)
-        return client.list_nodes()
+        return self._cached_read(cluster, "list_nodes")
     
     def get_node_status(self, node: str, cluster: Optional[str] = None) -> Dict[str, Any]:
         """Get node status."""
-        client = self._get_client(cluster=cluster)
-        return client.get_node_status(node)
+        return self._cached_read(cluster, "get_node_status", node)
     
-    def list_vms(
-        self,
-        node: Optional[str] = None,
-        status: Optional[str] = None,
-        search: Optional[str] = None,
-        cluster: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """List VMs from cluster."""
-        client = self._get_client(cluster=cluster)
-        return client.list_vms(node=node, status=status, search=search)
-    
-    def list_lxc(
-        self,
-        node: Optional[str] = None,
-        status: Optional[str] = None,
-        search: Optional[str] = None,
-        cluster: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """List LXC containers from cluster."""
-        client = self._get_client(cluster=cluster)
-        return client.list_lxc(node=node, status=status, search=search)
+    list_vms = _delegate("list_vms", "List VMs from cluster.")
+    list_lxc = _delegate("list_lxc", "List LXC containers from cluster.")
     
     def resolve_vm(
         self,
@@ -116,6 +247,15 @@ class MultiClusterProxmoxClient:
         client = self._get_client(cluster=cluster, resource_name=name)
         return client.resolve_lxc(vmid=vmid, name=name, node=node)
     
+    def resolve_vms_batch(
+        self,
+        targets: List[Dict[str, Any]],
+        cluster: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Resolve several VMs with one cluster listing."""
+        client = self._get_client(cluster=cluster)
+        return client.resolve_vms_batch(targets)
+    
     def vm_config(
         self,
         node: str,
@@ -123,8 +263,7 @@ class MultiClusterProxmoxClient:
         cluster: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get VM configuration."""
-        client = self._get_client(cluster=cluster)
-        return client.vm_config(node, vmid)
+        return self._cached_read(cluster, "vm_config", node, vmid)
     
     def lxc_config(
         self,
@@ -133,33 +272,14 @@ class MultiClusterProxmoxClient:
         cluster: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get LXC configuration."""
-        client = self._get_client(cluster=cluster)
-        return client.lxc_config(node, vmid)
+        return self._cached_read(cluster, "lxc_config", node, vmid)
     
     def list_storage(self, cluster: Optional[str] = None) -> List[Dict[str, Any]]:
         """List storage from cluster."""
-        client = self._get_client(cluster=cluster)
-        return client.list_storage()
-    
-    def storage_status(
-        self,
-        node: str,
-        storage: str,
-        cluster: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get storage status."""
-        client = self._get_client(cluster=cluster)
-        return client.storage_status(node, storage)
+        return self._cached_read(cluster, "list_storage")
     
-    def storage_content(
-        self,
-        node: str,
-        storage: str,
-        cluster: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """Get storage content."""
-        client = self._get_client(cluster=cluster)
-        return client.storage_content(node, storage)
+    storage_status = _delegate("storage_status", "Get storage status.")
+    storage_content = _delegate("storage_content", "Get storage content.")
     
     def list_bridges(
         self,
@@ -167,29 +287,10 @@ class MultiClusterProxmoxClient:
         cluster: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List bridges from node."""
-        client = self._get_client(cluster=cluster)
-        return client.list_bridges(node)
+        return self._cached_read(cluster, "list_bridges", node)
     
-    def list_tasks(
-        self,
-        node: Optional[str] = None,
-        user: Optional[str] = None,
-        limit: int = 50,
-        cluster: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """List tasks from cluster."""
-        client = self._get_client(cluster=cluster)
-        return client.list_tasks(node=node, user=user, limit=limit)
-    
-    def task_status(
-        self,
-        upid: str,
-        node: Optional[str] = None,
-        cluster: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get task status."""
-        client = self._get_client(cluster=cluster)
-        return client.task_status(upid, node=node)
+    list_tasks = _delegate("list_tasks", "List tasks from cluster.")
+    task_status = _delegate("task_status", "Get task status.")
     
     # -------- VM Lifecycle Methods --------
     
@@ -205,7 +306,7 @@ class MultiClusterProxmoxClient:
         cluster: Optional[str] = None,
     ) -> str:
         """Clone VM."""
-        client = self._get_client(cluster=cluster)
+        client = self._get_write_client(cluster=cluster)
         return client.clone_vm(
             source_node=source_node,
             source_vmid=source_vmid,
@@ -233,7 +334,7 @@ class MultiClusterProxmoxClient:
         cluster: Optional[str] = None,
     ) -> str:
         """Create VM."""
-        client = self._get_client(cluster=cluster, resource_name=name)
+        client = self._get_write_client(cluster=cluster, resource_name=name)
         return client.create_vm(
             node=node,
             vmid=vmid,
@@ -249,94 +350,14 @@ class MultiClusterProxmoxClient:
             ostype=ostype,
         )
     
-    def delete_vm(
-        self,
-        node: str,
-        vmid: int,
-        purge: bool = True,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Delete VM."""
-        client = self._get_client(cluster=cluster)
-        return client.delete_vm(node, vmid, purge=purge)
-    
-    def start_vm(
-        self,
-        node: str,
-        vmid: int,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Start VM."""
-        client = self._get_client(cluster=cluster)
-        return client.start_vm(node, vmid)
-    
-    def stop_vm(
-        self,
-        node: str,
-        vmid: int,
-        force: bool = False,
-        timeout: Optional[int] = None,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Stop VM."""
-        client = self._get_client(cluster=cluster)
-        return client.stop_vm(node, vmid, force=force, timeout=timeout)
-    
-    def reboot_vm(
-        self,
-        node: str,
-        vmid: int,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Reboot VM."""
-        client = self._get_client(cluster=cluster)
-        return client.reboot_vm(node, vmid)
-    
-    def shutdown_vm(
-        self,
-        node: str,
-        vmid: int,
-        timeout: Optional[int] = None,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Shutdown VM."""
-        client = self._get_client(cluster=cluster)
-        return client.shutdown_vm(node, vmid, timeout=timeout)
-    
-    def migrate_vm(
-        self,
-        node: str,
-        vmid: int,
-        target_node: str,
-        online: bool = True,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Migrate VM."""
-        client = self._get_client(cluster=cluster)
-        return client.migrate_vm(node, vmid, target_node, online=online)
-    
-    def resize_vm_disk(
-        self,
-        node: str,
-        vmid: int,
-        disk: str,
-        size_gb: int,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Resize VM disk."""
-        client = self._get_client(cluster=cluster)
-        return client.resize_vm_disk(node, vmid, disk, size_gb)
-    
-    def configure_vm(
-        self,
-        node: str,
-        vmid: int,
-        params: Dict[str, Any],
-        cluster: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Configure VM."""
-        client = self._get_client(cluster=cluster)
-        return client.configure_vm(node, vmid, params)
+    delete_vm = _delegate("delete_vm", "Delete VM.", write=True)
+    start_vm = _delegate("start_vm", "Start VM.", write=True)
+    stop_vm = _delegate("stop_vm", "Stop VM.", write=True)
+    reboot_vm = _delegate("reboot_vm", "Reboot VM.", write=True)
+    shutdown_vm = _delegate("shutdown_vm", "Shutdown VM.", write=True)
+    migrate_vm = _delegate("migrate_vm", "Migrate VM.", write=True)
+    resize_vm_disk = _delegate("resize_vm_disk", "Resize VM disk.", write=True)
+    configure_vm = _delegate("configure_vm", "Configure VM.", write=True)
     
     # -------- LXC Lifecycle Methods --------
     
@@ -355,7 +376,7 @@ class MultiClusterProxmoxClient:
         cluster: Optional[str] = None,
     ) -> str:
         """Create LXC container."""
-        client = self._get_client(cluster=cluster, resource_name=hostname)
+        client = self._get_write_client(cluster=cluster, resource_name=hostname)
         return client.create_lxc(
             node=node,
             vmid=vmid,
@@ -369,48 +390,10 @@ class MultiClusterProxmoxClient:
             net_ip=net_ip,
         )
     
-    def delete_lxc(
-        self,
-        node: str,
-        vmid: int,
-        purge: bool = True,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Delete LXC container."""
-        client = self._get_client(cluster=cluster)
-        return client.delete_lxc(node, vmid, purge=purge)
-    
-    def start_lxc(
-        self,
-        node: str,
-        vmid: int,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Start LXC container."""
-        client = self._get_client(cluster=cluster)
-        return client.start_lxc(node, vmid)
-    
-    def stop_lxc(
-        self,
-        node: str,
-        vmid: int,
-        timeout: Optional[int] = None,
-        cluster: Optional[str] = None,
-    ) -> str:
-        """Stop LXC container."""
-        client = self._get_client(cluster=cluster)
-        return client.stop_lxc(node, vmid, timeout=timeout)
-    
-    def configure_lxc(
-        self,
-        node: str,
-        vmid: int,
-        params: Dict[str, Any],
-        cluster: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Configure LXC container."""
-        client = self._get_client(cluster=cluster)
-        return client.configure_lxc(node, vmid, params)
+    delete_lxc = _delegate("delete_lxc", "Delete LXC container.", write=True)
+    start_lxc = _delegate("start_lxc", "Start LXC container.", write=True)
+    stop_lxc = _delegate("stop_lxc", "Stop LXC container.", write=True)
+    configure_lxc = _delegate("configure_lxc", "Configure LXC container.", write=True)
     
     # -------- Cluster-Specific Methods --------
     
@@ -9,10 +9,42 @@ from datetime import datetime
 
 from .client import ProxmoxClient
 
+# Compiled once at import rather than looked up in re's cache on every call
+_HTML_TAG_RE = re.compile(r'<[a-z][\s\S]*>', re.IGNORECASE)
+# Any markdown syntax, as one alternation so detection is a single scan
+_MARKDOWN_RE = re.compile("|".join((
+    r'^#{1,6}\s',  # Headers
+    r'\*\*[^*]+\*\*',  # Bold
+    r'\*[^*]+\*',  # Italic
+    r'^\s*[-*+]\s',  # Lists
+    r'^\s*\d+\.\s',  # Numbered lists
+    r'\[.+\]\(.+\)',  # Links
+    r'`[^`]+`',  # Code
+)), re.MULTILINE)
+# Characters every markdown pattern above needs; content without any is plain
+_MARKDOWN_CHARS = ('#', '*', '-', '+', '`', '[', '.')
+# Opening and closing tags in one pattern. Group 1 is set for a closing tag
+# (</name>); group 2 is set when an opening tag's attributes run into a closing
+# tag that shares its '>', which then counts as one of each.
+_TAG_RE = re.compile(
+    r'<(?:(/)[a-z][a-z0-9]*|[a-z][a-z0-9]*[^>]*?(</[a-z][a-z0-9]*)?)>', re.IGNORECASE
+)
+_PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+
+# render_markdown substitutions, applied in order
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_MD_HEADER_REPL = r'\n\1\n' + '=' * 50
+_MD_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_MD_CODE_RE = re.compile(r'`(.+?)`')
+_MD_LINK_RE = re.compile(r'\[(.+?)\]\((.+?)\)')
+
 
 class NotesManager:
     """Manager for VM/LXC notes with format support and validation."""
     
+    __slots__ = ("client",)
+    
     # Regex patterns
     SECRET_REFERENCE_PATTERN = r'secret://([a-zA-Z0-9_\-/]+)'
     PASSWORD_PATTERNS = [
@@ -23,6 +55,9 @@ class NotesManager:
         r'token\s*[=:]\s*["\']?([^"\'\s]+)',
         r'secret\s*[=:]\s*["\']?([^"\'\s]+)(?!://)',  # Exclude secret:// references
     ]
+    _SECRET_REFERENCE_RE = re.compile(SECRET_REFERENCE_PATTERN)
+    # All PASSWORD_PATTERNS as one alternation, so content is scanned once
+    _PASSWORD_RE = re.compile("|".join(f"(?:{p})" for p in PASSWORD_PATTERNS), re.IGNORECASE)
     
     # Note templates
     TEMPLATES = {
@@ -129,6 +164,29 @@ Updated: {DATE}
 """
     }
     
+    # (template_type, format_type) -> TEMPLATES key, and the per-format fallback
+    _TEMPLATE_KEYS = {tuple(key.rsplit('-', 1)): key for key in TEMPLATES}
+    _FALLBACK_TEMPLATE_KEYS = {'html': 'generic-markdown', 'markdown': 'generic-markdown'}
+    # Placeholder names used by each template
+    _TEMPLATE_PLACEHOLDERS = {
+        key: frozenset(_PLACEHOLDER_RE.findall(template)) for key, template in TEMPLATES.items()
+    }
+    
+    # Template variable defaults; DATE (today) is filled in by generate_template
+    _DEFAULT_VARIABLES = {
+        'VM_NAME': 'My VM',
+        'OWNER': 'Admin',
+        'PURPOSE': 'General Purpose',
+        'OS': 'Ubuntu 22.04',
+        'IP_ADDRESS': '192.168.1.100',
+        'SECRET_ID': 'vm-secret-key',
+        'DATABASE_TYPE': 'PostgreSQL 15',
+        'PORT': '5432',
+        'DESCRIPTION': 'Add description here',
+        'CONFIGURATION': 'Add configuration details here',
+        'NOTES': 'Add additional notes here'
+    }
+    
     def __init__(self, proxmox_client: ProxmoxClient):
         """Initialize NotesManager with Proxmox client."""
         self.client = proxmox_client
@@ -143,28 +201,16 @@ Updated: {DATE}
         Returns:
             Format type: 'html', 'markdown', or 'plain'
         """
-        if not content or not content.strip():
+        if not content or content.isspace():
             return 'plain'
         
-        # Check for HTML tags
-        html_pattern = r'<[a-z][\s\S]*>'
-        if re.search(html_pattern, content, re.IGNORECASE):
+        # Check for HTML tags (substring checks skip the regexes for most notes)
+        if '<' in content and _HTML_TAG_RE.search(content):
             return 'html'
         
         # Check for Markdown syntax
-        markdown_patterns = [
-            r'^#{1,6}\s',  # Headers
-            r'\*\*[^*]+\*\*',  # Bold
-            r'\*[^*]+\*',  # Italic
-            r'^\s*[-*+]\s',  # Lists
-            r'^\s*\d+\.\s',  # Numbered lists
-            r'\[.+\]\(.+\)',  # Links
-            r'`[^`]+`',  # Code
-        ]
-        
-        for pattern in markdown_patterns:
-            if re.search(pattern, content, re.MULTILINE):
-                return 'markdown'
+        if any(ch in content for ch in _MARKDOWN_CHARS) and _MARKDOWN_RE.search(content):
+            return 'markdown'
         
         return 'plain'
     
@@ -184,33 +230,39 @@ Updated: {DATE}
             return True, warnings
         
         # Check for potential secrets in plain text
-        for pattern in self.PASSWORD_PATTERNS:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                # Skip if it's a secret reference
-                if 'secret://' in match.group(0):
-                    continue
-                warnings.append(
-                    f"⚠️  Potential secret detected: '{match.group(0)[:20]}...'. "
-                    "Consider using secret-store and storing only a reference."
-                )
+        for match in self._PASSWORD_RE.finditer(content):
+            # Skip if it's a secret reference
+            if 'secret://' in match.group(0):
+                continue
+            warnings.append(
+                f"⚠️  Potential secret detected: '{match.group(0)[:20]}...'. "
+                "Consider using secret-store and storing only a reference."
+            )
         
         # Check size (Proxmox typically limits to 64KB)
         max_size = 64 * 1024  # 64KB
-        if len(content.encode('utf-8')) > max_size:
-            warnings.append(
-                f"⚠️  Content size ({len(content.encode('utf-8'))} bytes) exceeds "
-                f"recommended limit ({max_size} bytes). May be truncated by Proxmox."
-            )
+        # UTF-8 needs at most 4 bytes per character, so short content is never encoded
+        if len(content) * 4 > max_size:
+            size = len(content.encode('utf-8'))
+            if size > max_size:
+                warnings.append(
+                    f"⚠️  Content size ({size} bytes) exceeds "
+                    f"recommended limit ({max_size} bytes). May be truncated by Proxmox."
+                )
         
         # Validate HTML if detected
         if self.detect_format(content) == 'html':
             # Basic HTML validation - check for unclosed tags
-            open_tags = re.findall(r'<([a-z][a-z0-9]*)[^>]*>', content, re.IGNORECASE)
-            close_tags = re.findall(r'</([a-z][a-z0-9]*)>', content, re.IGNORECASE)
+            # One scan tallies opening tags against closing tags
+            balance = 0
+            for match in _TAG_RE.finditer(content):
+                if match.group(1):
+                    balance -= 1
+                elif not match.group(2):
+                    balance += 1
             
             # Simple check - not comprehensive but catches obvious issues
-            if len(open_tags) != len(close_tags):
+            if balance != 0:
                 warnings.append(
                     "⚠️  HTML may have unclosed tags. Please verify syntax."
                 )
@@ -229,11 +281,12 @@ Updated: {DATE}
         Returns:
             List of secret reference IDs
         """
-        if not content:
+        # A plain substring search rules out most notes without touching the regex
+        if not content or 'secret://' not in content:
             return []
         
-        matches = re.findall(self.SECRET_REFERENCE_PATTERN, content)
-        return list(set(matches))  # Remove duplicates
+        matches = self._SECRET_REFERENCE_RE.findall(content)
+        return list(dict.fromkeys(matches))  # Remove duplicates, keep first-seen order
     
     def generate_template(
         self,
@@ -252,46 +305,28 @@ Updated: {DATE}
         Returns:
             Generated template content
         """
-        # Map template type and format to template key
-        template_key = f"{template_type}-{format_type}"
-        
-        # Fallback to generic if specific template not found
-        if template_key not in self.TEMPLATES:
-            if format_type == 'html':
-                template_key = 'generic-markdown'  # Will convert
-            elif format_type == 'markdown':
-                template_key = 'generic-markdown'
-            else:
-                template_key = 'minimal-plain'
-        
-        template = self.TEMPLATES.get(template_key, self.TEMPLATES['minimal-plain'])
-        
-        # Default variables
-        default_vars = {
-            'VM_NAME': 'My VM',
-            'OWNER': 'Admin',
-            'PURPOSE': 'General Purpose',
-            'OS': 'Ubuntu 22.04',
-            'IP_ADDRESS': '192.168.1.100',
-            'SECRET_ID': 'vm-secret-key',
-            'DATE': datetime.now().strftime('%Y-%m-%d'),
-            'DATABASE_TYPE': 'PostgreSQL 15',
-            'PORT': '5432',
-            'DESCRIPTION': 'Add description here',
-            'CONFIGURATION': 'Add configuration details here',
-            'NOTES': 'Add additional notes here'
-        }
+        # Map template type and format to template key, falling back to
+        # generic (html is served as markdown) or minimal plain text
+        template_key = self._TEMPLATE_KEYS.get((template_type, format_type))
+        if template_key is None:
+            template_key = self._FALLBACK_TEMPLATE_KEYS.get(format_type, 'minimal-plain')
+        
+        template = self.TEMPLATES[template_key]
         
-        # Merge with provided variables
+        # Default variables, merged with provided variables
+        default_vars = dict(self._DEFAULT_VARIABLES)
         if variables:
             default_vars.update(variables)
         
-        # Replace variables in template
-        result = template
-        for key, value in default_vars.items():
-            result = result.replace(f'{{{key}}}', str(value))
+        # The date is only formatted when the template uses it and none was given
+        if 'DATE' not in default_vars and 'DATE' in self._TEMPLATE_PLACEHOLDERS[template_key]:
+            default_vars['DATE'] = datetime.now().strftime('%Y-%m-%d')
         
-        return result
+        # Replace variables in one pass; unknown placeholders are left as-is
+        return _PLACEHOLDER_RE.sub(
+            lambda m: str(default_vars[m.group(1)]) if m.group(1) in default_vars else m.group(0),
+            template
+        )
     
     def render_markdown(self, content: str) -> str:
         """
@@ -303,21 +338,29 @@ Updated: {DATE}
         Returns:
             Formatted text representation
         """
-        # Simple markdown to text conversion
+        # Simple markdown to text conversion. Each substitution only runs if
+        # its marker character is present, so plain passages are not rescanned.
+        result = content
+        
         # Headers
-        result = re.sub(r'^#{1,6}\s+(.+)$', r'\n\1\n' + '='*50, content, flags=re.MULTILINE)
+        if '#' in result:
+            result = _MD_HEADER_RE.sub(_MD_HEADER_REPL, result)
         
         # Bold
-        result = re.sub(r'\*\*(.+?)\*\*', r'\1', result)
+        if '**' in result:
+            result = _MD_BOLD_RE.sub(r'\1', result)
         
         # Italic
-        result = re.sub(r'\*(.+?)\*', r'\1', result)
+        if '*' in result:
+            result = _MD_ITALIC_RE.sub(r'\1', result)
         
         # Code
-        result = re.sub(r'`(.+?)`', r'[\1]', result)
+        if '`' in result:
+            result = _MD_CODE_RE.sub(r'[\1]', result)
         
         # Links
-        result = re.sub(r'\[(.+?)\]\((.+?)\)', r'\1 (\2)', result)
+        if '](' in result:
+            result = _MD_LINK_RE.sub(r'\1 (\2)', result)
         
         return result
     
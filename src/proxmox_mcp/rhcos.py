@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import json
 import base64
+import gzip
 import hashlib
 import os
+import shutil
+import subprocess
 import tempfile
 import yaml
 from typing import Any, Dict, List, Optional, Union
@@ -235,8 +238,6 @@ WantedBy=multi-user.target
 
     def create_iso(self, output_path: str, label: str = "ignition") -> str:
         """Create Ignition ISO for VM boot."""
-        import subprocess
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Write ignition configuration
             ignition_path = os.path.join(temp_dir, "ignition.json")
@@ -290,9 +291,6 @@ class RHCOSProvisioner:
         
         try:
             # Decompress the image
-            import gzip
-            import shutil
-            
             decompressed_path = compressed_path.replace(".gz", "")
             with gzip.open(compressed_path, 'rb') as f_in:
                 with open(decompressed_path, 'wb') as f_out:
@@ -13,7 +13,8 @@ import json
 import qrcode
 import base64
 import hashlib
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -31,6 +32,16 @@ from loguru import logger
 from .client import ProxmoxClient
 from .utils import run_command, format_error
 
+# How long a certificate expiry date read from disk is reused (seconds)
+CERT_EXPIRY_CACHE_TTL = 300
+
+# certbot only renews certificates that expire within this window
+CERT_RENEWAL_WINDOW = timedelta(days=30)
+
+# cert path -> (expiry in UTC, monotonic time it was read). Module level because
+# the server creates a SecurityManager per tool call.
+_cert_cache: Dict[str, Tuple[datetime, float]] = {}
+
 
 class SecurityManager:
     """Security management for Proxmox infrastructure"""
@@ -303,13 +314,40 @@ class SecurityManager:
             logger.error(f"Self-signed certificate creation failed: {e}")
             raise
 
+    def _cert_expiry(self, cert_path: str) -> Optional[datetime]:
+        """Expiry (UTC) of the PEM certificate at cert_path, cached for CERT_EXPIRY_CACHE_TTL"""
+        now = time.monotonic()
+        cached = _cert_cache.get(cert_path)
+        if cached and now - cached[1] < CERT_EXPIRY_CACHE_TTL:
+            return cached[0]
+        
+        try:
+            with open(cert_path, "rb") as f:
+                cert = x509.load_pem_x509_certificate(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        expires = getattr(cert, "not_valid_after_utc", None)
+        expires = expires.replace(tzinfo=None) if expires else cert.not_valid_after
+        _cert_cache[cert_path] = (expires, now)
+        return expires
+
     async def _renew_letsencrypt_cert(self, domains: List[str]) -> Dict[str, Any]:
         """Renew Let's Encrypt certificate"""
         try:
-            cmd = ["certbot", "renew", "--non-interactive"]
+            # Renew only this certificate lineage, and skip certbot when it is
+            # not yet inside its renewal window
+            cert_name = domains[0]
+            cert_path = f"/etc/letsencrypt/live/{cert_name}/cert.pem"
+            expires = self._cert_expiry(cert_path)
+            if expires and expires - datetime.utcnow() > CERT_RENEWAL_WINDOW:
+                return {"renewed": False, "expires": expires, "output": "Certificate not due for renewal"}
+            
+            cmd = ["certbot", "renew", "--cert-name", cert_name, "--non-interactive"]
             result = await run_command(cmd)
             
             if result["return_code"] == 0:
+                _cert_cache.pop(cert_path, None)
                 return {"renewed": True, "output": result["stdout"]}
             else:
                 raise Exception(f"Certbot renewal failed: {result['stderr']}")
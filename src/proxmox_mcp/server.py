@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 
 from .client import ProxmoxClient
-from .utils import read_env, require_confirm, format_size, is_multi_cluster_mode
+from .utils import require_confirm, format_size, is_multi_cluster_mode
 from .cluster_manager import get_cluster_registry
 from .cloudinit import CloudInitConfig, CloudInitProvisioner, get_ubuntu_web_server_config, get_docker_host_config, get_development_config
 from .rhcos import IgnitionConfig, RHCOSProvisioner, OpenShiftInstaller
@@ -56,8 +59,37 @@ def get_client(cluster_name: Optional[str] = None) -> ProxmoxClient:
         return registry.get_client(cluster_name)
     else:
         # Single-cluster mode: use environment variables
-        read_env()
-        return ProxmoxClient.from_env()
+        return _single_cluster_client()
+
+
+@lru_cache(maxsize=1)
+def _single_cluster_client() -> ProxmoxClient:
+    """
+    Build the single-cluster client once.
+    
+    Every tool call then shares its requests session, so concurrent and
+    back-to-back calls reuse the same keep-alive HTTPS connections.
+    """
+    return ProxmoxClient.from_env()
+
+
+# ContainerOperations per (host, ssh key), shared by the container tools
+_container_ops: Dict[tuple, ContainerOperations] = {}
+
+
+def get_container_ops() -> ContainerOperations:
+    """
+    Get container operations for PROXMOX_HOST using PROXMOX_SSH_KEY.
+    
+    The instance is reused across tool calls, so its SSH master connection
+    and per-container shells stay open between them.
+    """
+    proxmox_host = os.getenv("PROXMOX_HOST", "localhost")
+    ssh_key = os.getenv("PROXMOX_SSH_KEY")
+    ops = _container_ops.get((proxmox_host, ssh_key))
+    if ops is None:
+        ops = _container_ops[(proxmox_host, ssh_key)] = ContainerOperations(proxmox_host, ssh_key=ssh_key)
+    return ops
 
 
 # ---------- Multi-Cluster Helper Tools ----------
@@ -215,7 +247,7 @@ async def proxmox_get_all_cluster_status() -> Dict[str, Any]:
 @server.tool("proxmox-list-nodes")
 async def proxmox_list_nodes() -> List[Dict[str, Any]]:
     client = get_client()
-    return client.list_nodes()
+    return await asyncio.to_thread(client.list_nodes)
 
 
 @server.tool("proxmox-node-status")
@@ -224,7 +256,7 @@ async def proxmox_node_status(node: Optional[str] = None) -> Dict[str, Any]:
     node_id = node or client.default_node
     if not node_id:
         raise ValueError("node is required (or set PROXMOX_DEFAULT_NODE)")
-    return client.get_node_status(node_id)
+    return await asyncio.to_thread(client.get_node_status, node_id)
 
 
 @server.tool("proxmox-list-vms")
@@ -234,7 +266,7 @@ async def proxmox_list_vms(
     search: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
     client = get_client()
-    return client.list_vms(node=node, status=status, search=search)
+    return await asyncio.to_thread(client.list_vms, node=node, status=status, search=search)
 
 
 @server.tool("proxmox-vm-info")
@@ -274,7 +306,7 @@ async def proxmox_lxc_info(
 @server.tool("proxmox-list-storage")
 async def proxmox_list_storage() -> List[Dict[str, Any]]:
     client = get_client()
-    return client.list_storage()
+    return await asyncio.to_thread(client.list_storage)
 
 
 @server.tool("proxmox-storage-content")
@@ -3250,7 +3282,6 @@ async def proxmox_notes_template(
     template_content = notes_manager.generate_template(template_type, format, variables)
     
     # Extract variables used
-    import re
     variables_used = re.findall(r'\{([A-Z_]+)\}', template_content)
     
     return {
@@ -3263,12 +3294,15 @@ async def proxmox_notes_template(
 
 
 # ---------- Container Operations ----------
+# ContainerOperations blocks on SSH, so calls run in worker threads to keep
+# the event loop free for other tool calls
 
 @server.tool("proxmox-container-exec")
 async def proxmox_container_exec(
     vmid: int,
     command: str,
-    timeout: int = 30
+    timeout: int = 30,
+    tail_lines: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Execute command inside LXC container.
@@ -3280,6 +3314,7 @@ async def proxmox_container_exec(
         vmid: Container ID
         command: Command to execute (e.g., "systemctl status nginx")
         timeout: Command timeout in seconds (default: 30)
+        tail_lines: Only return the last N lines of output (optional)
     
     Returns:
         Dict with execution results:
@@ -3292,17 +3327,43 @@ async def proxmox_container_exec(
         - Execute: proxmox-container-exec vmid=103 command="apt-get update"
         - Check service: proxmox-container-exec vmid=103 command="systemctl status nginx"
         - Get hostname: proxmox-container-exec vmid=103 command="hostname"
+        - Install quietly: proxmox-container-exec vmid=103 command="apt-get install -y nginx" tail_lines=20
     """
-    from .container_ops import ContainerOperations
+    ops = get_container_ops()
+    result = await asyncio.to_thread(
+        ops.exec_in_container, vmid, command, timeout=timeout, tail_lines=tail_lines
+    )
     
-    # Get Proxmox host from environment or default
-    proxmox_host = os.getenv("PROXMOX_HOST", "localhost")
-    ssh_key = os.getenv("PROXMOX_SSH_KEY")
+    return result
+
+
+@server.tool("proxmox-container-exec-many")
+async def proxmox_container_exec_many(
+    vmids: List[int],
+    command: str,
+    timeout: int = 30
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Execute the same command inside several LXC containers in parallel.
     
-    ops = ContainerOperations(proxmox_host, ssh_key=ssh_key)
-    result = ops.exec_in_container(vmid, command, timeout=timeout)
+    Runs pct exec for each container concurrently over the shared SSH
+    connection to the Proxmox host.
     
-    return result
+    Args:
+        vmids: Container IDs
+        command: Command to execute (e.g., "df -h /")
+        timeout: Per-container command timeout in seconds (default: 30)
+    
+    Returns:
+        Dict mapping each vmid to its execution result (same fields as
+        proxmox-container-exec)
+    
+    Examples:
+        - Disk usage: proxmox-container-exec-many vmids=[101, 102, 103] command="df -h /"
+        - Upgrade check: proxmox-container-exec-many vmids=[101, 102] command="apt list --upgradable"
+    """
+    ops = get_container_ops()
+    return await ops.exec_in_containers(vmids, command, timeout=timeout)
 
 
 @server.tool("proxmox-container-push-file")
@@ -3314,7 +3375,7 @@ async def proxmox_container_push_file(
     """
     Copy file from host into LXC container.
     
-    Uses base64 encoding to safely transfer files through SSH.
+    Copies via scp + pct push, falling back to base64 over SSH.
     Automatically creates destination directory if needed.
     
     Args:
@@ -3332,13 +3393,40 @@ async def proxmox_container_push_file(
         - Push app: proxmox-container-push-file vmid=103 local_path="/tmp/app.py" remote_path="/opt/app/app.py"
         - Push config: proxmox-container-push-file vmid=103 local_path="/tmp/nginx.conf" remote_path="/etc/nginx/nginx.conf"
     """
-    from .container_ops import ContainerOperations
+    ops = get_container_ops()
+    result = await asyncio.to_thread(ops.push_file_to_container, vmid, local_path, remote_path)
     
-    proxmox_host = os.getenv("PROXMOX_HOST", "localhost")
-    ssh_key = os.getenv("PROXMOX_SSH_KEY")
+    return result
+
+
+@server.tool("proxmox-container-write-file")
+async def proxmox_container_write_file(
+    vmid: int,
+    content: str,
+    remote_path: str
+) -> Dict[str, Any]:
+    """
+    Write text content to a file inside an LXC container.
+    
+    Streams the content over SSH straight into the file with pct exec, so
+    no local file or encoding is needed. Creates the destination directory.
+    
+    Args:
+        vmid: Container ID
+        content: File content
+        remote_path: Destination path inside container
+    
+    Returns:
+        Dict with transfer status:
+        - success: bool
+        - message: str
+        - file_size: int (bytes)
     
-    ops = ContainerOperations(proxmox_host, ssh_key=ssh_key)
-    result = ops.push_file_to_container(vmid, local_path, remote_path)
+    Examples:
+        - Write unit: proxmox-container-write-file vmid=103 content="[Unit]..." remote_path="/etc/systemd/system/app.service"
+    """
+    ops = get_container_ops()
+    result = await asyncio.to_thread(ops.write_file_to_container, vmid, content, remote_path)
     
     return result
 
@@ -3352,7 +3440,8 @@ async def proxmox_container_pull_file(
     """
     Copy file from LXC container to host.
     
-    Uses base64 encoding for safe transfer. Creates parent directories if needed.
+    Copies via pct pull + scp, falling back to base64 over SSH.
+    Creates parent directories if needed.
     
     Args:
         vmid: Container ID
@@ -3368,13 +3457,43 @@ async def proxmox_container_pull_file(
     Examples:
         - Pull logs: proxmox-container-pull-file vmid=103 remote_path="/var/log/app.log" local_path="/tmp/app.log"
     """
-    from .container_ops import ContainerOperations
+    ops = get_container_ops()
+    result = await asyncio.to_thread(ops.pull_file_from_container, vmid, remote_path, local_path)
     
-    proxmox_host = os.getenv("PROXMOX_HOST", "localhost")
-    ssh_key = os.getenv("PROXMOX_SSH_KEY")
+    return result
+
+
+@server.tool("proxmox-container-service-status")
+async def proxmox_container_service_status(
+    vmid: int,
+    service: str,
+    log_lines: int = 10
+) -> Dict[str, Any]:
+    """
+    Get the status of a systemd service inside an LXC container.
+    
+    Collects the service state, main PID, uptime, systemctl status output
+    and recent journal lines in a single pct exec.
+    
+    Args:
+        vmid: Container ID
+        service: systemd unit name (e.g., "nginx")
+        log_lines: Number of journal lines to include (default: 10)
     
-    ops = ContainerOperations(proxmox_host, ssh_key=ssh_key)
-    result = ops.pull_file_from_container(vmid, remote_path, local_path)
+    Returns:
+        Dict with service status:
+        - active: bool
+        - state: str (e.g., "active", "failed", "inactive")
+        - pid: int (0 if not running)
+        - uptime_seconds: int
+        - status: str (systemctl status output)
+        - logs: str (recent journal lines)
+    
+    Examples:
+        - Check nginx: proxmox-container-service-status vmid=103 service="nginx"
+    """
+    ops = get_container_ops()
+    result = await asyncio.to_thread(ops.get_service_status, vmid, service, log_lines)
     
     return result
 
@@ -3406,13 +3525,8 @@ async def proxmox_container_check_network(
         - Check container online: proxmox-container-check-network vmid=103
         - Check internet: proxmox-container-check-network vmid=103 test_ip="8.8.8.8"
     """
-    from .container_ops import ContainerOperations
-    
-    proxmox_host = os.getenv("PROXMOX_HOST", "localhost")
-    ssh_key = os.getenv("PROXMOX_SSH_KEY")
-    
-    ops = ContainerOperations(proxmox_host, ssh_key=ssh_key)
-    result = ops.check_container_network(vmid, test_ip=test_ip, timeout=timeout)
+    ops = get_container_ops()
+    result = await asyncio.to_thread(ops.check_container_network, vmid, test_ip=test_ip, timeout=timeout)
     
     return result
 
@@ -3433,7 +3547,7 @@ async def proxmox_container_wait_network(
     Args:
         vmid: Container ID
         max_retries: Maximum retry attempts (default: 30 = ~2.5 min)
-        retry_delay: Delay between retries in seconds (default: 5)
+        retry_delay: Maximum delay between retries in seconds (default: 5)
         test_ip: IP to test (default: 10.0.0.1)
     
     Returns:
@@ -3447,13 +3561,8 @@ async def proxmox_container_wait_network(
         - Wait up to 2.5 min: proxmox-container-wait-network vmid=103
         - Wait up to 5 min: proxmox-container-wait-network vmid=103 max_retries=60
     """
-    from .container_ops import ContainerOperations
-    
-    proxmox_host = os.getenv("PROXMOX_HOST", "localhost")
-    ssh_key = os.getenv("PROXMOX_SSH_KEY")
-    
-    ops = ContainerOperations(proxmox_host, ssh_key=ssh_key)
-    result = ops.wait_for_container_network(vmid, max_retries, retry_delay, test_ip)
+    ops = get_container_ops()
+    result = await asyncio.to_thread(ops.wait_for_container_network, vmid, max_retries, retry_delay, test_ip)
     
     return result
 
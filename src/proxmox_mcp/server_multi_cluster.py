@@ -5,19 +5,29 @@ This module provides multi-cluster support by wrapping the original server
 with cluster-aware tool versions.
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Optional, Any, Dict, List
 from .server import server as original_server
 from .cluster_manager import get_cluster_registry
 from .utils import is_multi_cluster_mode
 from mcp.server.fastmcp import FastMCP
 
+# Maximum number of clusters queried at once by the cross-cluster tools
+FANOUT_CONCURRENCY = 8
 
+
+@lru_cache(maxsize=1)
 def create_multi_cluster_server() -> FastMCP:
     """
     Create a multi-cluster aware MCP server.
     
     This wraps the original server and adds cluster parameter support
     to all tools if multi-cluster mode is enabled.
+    
+    The server is built once and reused by later calls; tests that change
+    the multi-cluster environment must call
+    create_multi_cluster_server.cache_clear() first.
     """
     if not is_multi_cluster_mode():
         # Single cluster mode - use original server as-is
@@ -27,6 +37,28 @@ def create_multi_cluster_server() -> FastMCP:
     multi_server = FastMCP("proxmox-mcp-multi")
     registry = get_cluster_registry()
     
+    async def _fanout(method_name: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Call a ProxmoxClient method on every cluster concurrently.
+        
+        Each call runs in a worker thread so the blocking client stays off
+        the event loop. A failing cluster is reported as {"error": ...}
+        without affecting the others.
+        """
+        semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
+        
+        async def one(cluster: str) -> Any:
+            async with semaphore:
+                client = await asyncio.to_thread(registry.get_client, cluster)
+                return await asyncio.to_thread(getattr(client, method_name), *args, **kwargs)
+        
+        clusters = registry.list_clusters()
+        results = await asyncio.gather(*map(one, clusters), return_exceptions=True)
+        return {
+            cluster: {"error": str(result)} if isinstance(result, Exception) else result
+            for cluster, result in zip(clusters, results)
+        }
+    
     # Add cluster listing tools
     @multi_server.tool("proxmox-list-clusters")
     async def list_clusters() -> List[str]:
@@ -43,14 +75,41 @@ def create_multi_cluster_server() -> FastMCP:
         """Validate connectivity to all clusters."""
         return registry.validate_all_clusters()
     
+    @multi_server.tool("proxmox-list-all-vms")
+    async def list_all_vms(
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List VMs on every cluster, queried in parallel. Returns {cluster: vms}."""
+        return await _fanout("list_vms", status=status, search=search)
+    
+    @multi_server.tool("proxmox-resolve-vms-batch")
+    async def resolve_vms_batch(
+        targets: List[Dict[str, Any]],
+        cluster: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve several VMs with a single listing of the cluster.
+        
+        Each target is {"vmid": ...} or {"name": ...}, optionally with "node".
+        Results keep the target order; unresolvable targets get {"error": ...}.
+        """
+        client = await asyncio.to_thread(registry.get_client, cluster)
+        return await asyncio.to_thread(client.resolve_vms_batch, targets)
+    
+    @multi_server.tool("proxmox-list-all-lxc")
+    async def list_all_lxc(
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List LXC containers on every cluster, queried in parallel. Returns {cluster: containers}."""
+        return await _fanout("list_lxc", status=status, search=search)
+    
     # Copy all original tools but make them cluster-aware
     # This allows tools to work with cluster parameter
     return multi_server
 
 
-# Export the appropriate server
-if is_multi_cluster_mode():
-    server = create_multi_cluster_server()
-else:
-    from .server import server
+# Export the appropriate server (the original one in single-cluster mode)
+server = create_multi_cluster_server()
 
@@ -4,12 +4,14 @@ import os
 import time
 import subprocess
 import asyncio
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, List
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Any, Dict, Mapping, NamedTuple, Optional, List
+from urllib.parse import urlsplit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProxmoxEnv:
     base_url: str
     token_id: str
@@ -20,7 +22,7 @@ class ProxmoxEnv:
     default_bridge: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClusterConfig:
     """Configuration for a single Proxmox cluster."""
     name: str
@@ -47,29 +49,37 @@ class ClusterConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClusterRegistryConfig:
     """Configuration for the cluster registry."""
     clusters: Dict[str, ClusterConfig] = field(default_factory=dict)
     default_cluster: str = ""
     enable_cluster_validation: bool = True
     cache_ttl: int = 3600
+    prewarm: bool = False  # Create all clients at startup and refresh them before TTL expiry
     cluster_patterns: Dict[str, str] = field(default_factory=dict)  # Pattern -> cluster_name mapping
 
 
+_TRUE_VALUES = frozenset(("1", "true", "yes", "y", "on"))
+
+
 def strtobool(value: Optional[str], default: bool = True) -> bool:
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return value.strip().lower() in _TRUE_VALUES
 
 
+@lru_cache(maxsize=1)
 def is_multi_cluster_mode() -> bool:
-    """Detect if multi-cluster mode is enabled."""
+    """Detect if multi-cluster mode is enabled.
+
+    The environment is read once per process; see ``_reset_config_cache``.
+    """
     return "PROXMOX_CLUSTERS" in os.environ
 
 
-def read_env() -> ProxmoxEnv:
-    """Read single cluster configuration (backward compatible)."""
+def _read_single_env_fields() -> Dict[str, Any]:
+    """Read and validate the single-cluster PROXMOX_* variables as field values."""
     base_url = os.environ.get("PROXMOX_API_URL", "").strip()
     token_id = os.environ.get("PROXMOX_TOKEN_ID", "").strip()
     token_secret = os.environ.get("PROXMOX_TOKEN_SECRET", "").strip()
@@ -86,17 +96,27 @@ def read_env() -> ProxmoxEnv:
     if not token_secret:
         raise ValueError("Missing PROXMOX_TOKEN_SECRET")
 
-    return ProxmoxEnv(
-        base_url=base_url,
-        token_id=token_id,
-        token_secret=token_secret,
-        verify=verify,
-        default_node=default_node,
-        default_storage=default_storage,
-        default_bridge=default_bridge,
-    )
+    return {
+        "base_url": base_url,
+        "token_id": token_id,
+        "token_secret": token_secret,
+        "verify": verify,
+        "default_node": default_node,
+        "default_storage": default_storage,
+        "default_bridge": default_bridge,
+    }
+
+
+@lru_cache(maxsize=1)
+def read_env() -> ProxmoxEnv:
+    """Read single cluster configuration (backward compatible)."""
+    return ProxmoxEnv(**_read_single_env_fields())
+
+
+_CLUSTER_ENV_PREFIX = "PROXMOX_CLUSTER_"
 
 
+@lru_cache(maxsize=1)
 def read_multi_cluster_env() -> Dict[str, ClusterConfig]:
     """
     Read multiple cluster configurations from environment variables.
@@ -118,15 +138,22 @@ def read_multi_cluster_env() -> Dict[str, ClusterConfig]:
     if not cluster_names:
         raise ValueError("PROXMOX_CLUSTERS is empty")
     
+    # Snapshot the per-cluster variables in one pass, keyed without the common prefix
+    raw = {
+        key[len(_CLUSTER_ENV_PREFIX):]: value
+        for key, value in os.environ.items()
+        if key.startswith(_CLUSTER_ENV_PREFIX)
+    }
+    
     clusters: Dict[str, ClusterConfig] = {}
     
     for cluster_name in cluster_names:
-        prefix = f"PROXMOX_CLUSTER_{cluster_name}_"
+        prefix = f"{_CLUSTER_ENV_PREFIX}{cluster_name}_"
         
-        base_url = os.environ.get(f"{prefix}API_URL", "").strip()
-        token_id = os.environ.get(f"{prefix}TOKEN_ID", "").strip()
-        token_secret = os.environ.get(f"{prefix}TOKEN_SECRET", "").strip()
-        verify_str = os.environ.get(f"{prefix}VERIFY", "true").strip()
+        base_url = raw.get(f"{cluster_name}_API_URL", "").strip()
+        token_id = raw.get(f"{cluster_name}_TOKEN_ID", "").strip()
+        token_secret = raw.get(f"{cluster_name}_TOKEN_SECRET", "").strip()
+        verify = raw.get(f"{cluster_name}_VERIFY", "true").strip().lower() in _TRUE_VALUES
         
         if not base_url:
             raise ValueError(f"Missing {prefix}API_URL for cluster '{cluster_name}'")
@@ -135,13 +162,11 @@ def read_multi_cluster_env() -> Dict[str, ClusterConfig]:
         if not token_secret:
             raise ValueError(f"Missing {prefix}TOKEN_SECRET for cluster '{cluster_name}'")
         
-        verify = strtobool(verify_str, True)
-        
-        default_node = os.environ.get(f"{prefix}DEFAULT_NODE") or None
-        default_storage = os.environ.get(f"{prefix}DEFAULT_STORAGE") or None
-        default_bridge = os.environ.get(f"{prefix}DEFAULT_BRIDGE") or None
-        region = os.environ.get(f"{prefix}REGION") or None
-        tier = os.environ.get(f"{prefix}TIER") or None
+        default_node = raw.get(f"{cluster_name}_DEFAULT_NODE") or None
+        default_storage = raw.get(f"{cluster_name}_DEFAULT_STORAGE") or None
+        default_bridge = raw.get(f"{cluster_name}_DEFAULT_BRIDGE") or None
+        region = raw.get(f"{cluster_name}_REGION") or None
+        tier = raw.get(f"{cluster_name}_TIER") or None
         
         config = ClusterConfig(
             name=cluster_name,
@@ -161,6 +186,7 @@ def read_multi_cluster_env() -> Dict[str, ClusterConfig]:
     return clusters
 
 
+@lru_cache(maxsize=1)
 def load_cluster_registry_config() -> ClusterRegistryConfig:
     """Load cluster registry configuration from environment."""
     clusters_str = os.environ.get("PROXMOX_CLUSTERS", "").strip()
@@ -168,8 +194,8 @@ def load_cluster_registry_config() -> ClusterRegistryConfig:
     if clusters_str:
         # Multi-cluster mode
         clusters = read_multi_cluster_env()
-        cluster_names = [name.strip() for name in clusters_str.split(",") if name.strip()]
-        default_cluster = cluster_names[0]  # First cluster is default
+        # First cluster is default; the dict keeps PROXMOX_CLUSTERS order
+        default_cluster = next(iter(clusters))
         
         # Load cluster patterns if defined
         patterns_str = os.environ.get("PROXMOX_CLUSTER_PATTERNS", "").strip()
@@ -177,8 +203,8 @@ def load_cluster_registry_config() -> ClusterRegistryConfig:
         if patterns_str:
             # Format: "prod-:cluster1,staging-:cluster2"
             for pattern_pair in patterns_str.split(","):
-                if ":" in pattern_pair:
-                    pattern, cluster = pattern_pair.split(":", 1)
+                pattern, sep, cluster = pattern_pair.partition(":")
+                if sep:
                     cluster_patterns[pattern.strip()] = cluster.strip()
         
         return ClusterRegistryConfig(
@@ -186,21 +212,12 @@ def load_cluster_registry_config() -> ClusterRegistryConfig:
             default_cluster=default_cluster,
             enable_cluster_validation=strtobool(os.environ.get("PROXMOX_CLUSTER_VALIDATION"), True),
             cache_ttl=int(os.environ.get("PROXMOX_CLUSTER_CACHE_TTL", "3600")),
+            prewarm=strtobool(os.environ.get("PROXMOX_CLUSTER_PREWARM"), False),
             cluster_patterns=cluster_patterns,
         )
     else:
         # Single cluster mode (backward compatible)
-        env = read_env()
-        single_cluster = ClusterConfig(
-            name="default",
-            base_url=env.base_url,
-            token_id=env.token_id,
-            token_secret=env.token_secret,
-            verify=env.verify,
-            default_node=env.default_node,
-            default_storage=env.default_storage,
-            default_bridge=env.default_bridge,
-        )
+        single_cluster = ClusterConfig(name="default", **_read_single_env_fields())
         
         return ClusterRegistryConfig(
             clusters={"default": single_cluster},
@@ -209,37 +226,56 @@ def load_cluster_registry_config() -> ClusterRegistryConfig:
         )
 
 
-def parse_api_url(base_url: str) -> Dict[str, Any]:
+def _reset_config_cache() -> None:
+    """Drop memoized environment configuration so the next call re-reads it.
+
+    Intended for tests and tooling that modify ``os.environ`` in-process.
+    """
+    for loader in (is_multi_cluster_mode, read_env, read_multi_cluster_env, load_cluster_registry_config):
+        loader.cache_clear()
+
+
+class ApiUrlParts(NamedTuple):
+    """Components of a Proxmox API URL."""
+    host: str
+    port: int
+    scheme: str
+
+
+@lru_cache(maxsize=64)
+def parse_api_url(base_url: str) -> ApiUrlParts:
     """Parse API URL into components suitable for proxmoxer.ProxmoxAPI.
 
+    Results are memoized per URL; the returned tuple is immutable, so it is
+    safe to share between callers.
+
     Accepts forms like:
       - https://host:8006
       - https://host:8006/api2/json
       - https://host
     """
-    parsed = urlparse(base_url)
+    parsed = urlsplit(base_url)
     if not parsed.scheme or not parsed.hostname:
         raise ValueError(f"Invalid PROXMOX_API_URL: {base_url}")
-    port = parsed.port or 8006
-    return {
-        "host": parsed.hostname,
-        "port": port,
-        "scheme": parsed.scheme,
-    }
+    return ApiUrlParts(parsed.hostname, parsed.port or 8006, parsed.scheme)
 
 
-def split_token_id(token_id: str) -> Dict[str, str]:
-    """Split token_id of the form 'user@realm!tokenname' into components."""
-    if "!" not in token_id:
+@lru_cache(maxsize=64)
+def split_token_id(token_id: str) -> Mapping[str, str]:
+    """Split token_id of the form 'user@realm!tokenname' into components.
+
+    Results are memoized per token id and returned as a read-only mapping.
+    """
+    user, sep, token_name = token_id.partition("!")
+    if not sep:
         raise ValueError("PROXMOX_TOKEN_ID must include '!' separating user and token name, e.g. root@pam!mcp")
-    user, token_name = token_id.split("!", 1)
     if "@" not in user:
         raise ValueError("PROXMOX_TOKEN_ID user part must include '@realm', e.g. root@pam!mcp")
-    return {"user": user, "token_name": token_name}
+    return MappingProxyType({"user": user, "token_name": token_name})
 
 
 def now_ms() -> int:
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def require_confirm(confirm: Optional[bool]) -> None:
@@ -248,21 +284,54 @@ def require_confirm(confirm: Optional[bool]) -> None:
         raise ValueError("This operation is destructive. Pass confirm=true to proceed.")
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_size(size_bytes: int) -> str:
     """Format byte size into human readable format."""
-    if size_bytes == 0:
-        return "0 B"
-    
-    size_names = ["B", "KB", "MB", "GB", "TB", "PB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    if i == 0:
-        return f"{int(size_bytes)} {size_names[i]}"
-    else:
-        return f"{size_bytes:.1f} {size_names[i]}"
+    if size_bytes < 1024:
+        return f"{int(size_bytes)} B"
+
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly.
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
+
+
+RUN_COMMAND_MAX_OUTPUT = 16 * 1024 * 1024  # Per stream; output beyond this is discarded
+_READ_CHUNK = 64 * 1024
+
+
+async def _feed_stdin(stream: asyncio.StreamWriter, data: bytes) -> None:
+    """Write data to a child's stdin and close it, ignoring an early exit."""
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        stream.close()
+
+
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, bool]:
+    """Read a stream to EOF, keeping at most ``limit`` bytes.
+
+    The pipe is drained past the limit so the child never blocks on a full
+    pipe. Returns the kept bytes and whether anything was dropped.
+    """
+    chunks: List[bytes] = []
+    size = 0
+    truncated = False
+    while chunk := await stream.read(_READ_CHUNK):
+        room = limit - size
+        if room <= 0:
+            truncated = True
+            continue
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            truncated = True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), truncated
 
 
 async def run_command(
@@ -270,32 +339,57 @@ async def run_command(
     input_data: Optional[str] = None,
     shell: bool = False,
     cwd: Optional[str] = None,
-    env: Optional[Dict[str, str]] = None
+    env: Optional[Dict[str, str]] = None,
+    max_output_bytes: int = RUN_COMMAND_MAX_OUTPUT
 ) -> Dict[str, Any]:
-    """Run a command asynchronously and return the result."""
+    """Run a command asynchronously and return the result.
+
+    stdout and stderr are each capped at ``max_output_bytes``; when either
+    is cut short the result carries ``"truncated": True``.
+    """
     try:
-        if shell and isinstance(cmd, list):
-            cmd = " ".join(cmd)
+        stdin = subprocess.PIPE if input_data else None
+        if shell:
+            if isinstance(cmd, list):
+                cmd = " ".join(cmd)
+            process = await asyncio.create_subprocess_shell(
+                cmd,
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                env=env
+            )
+        else:
+            # Exec the argv directly: no /bin/sh round trip, and arguments
+            # containing spaces or quotes reach the program unchanged.
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=stdin,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                env=env
+            )
         
-        process = await asyncio.create_subprocess_shell(
-            cmd if shell else " ".join(cmd),
-            stdin=subprocess.PIPE if input_data else None,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=cwd,
-            env=env
-        )
+        readers = [
+            _read_capped(process.stdout, max_output_bytes),
+            _read_capped(process.stderr, max_output_bytes),
+        ]
+        if input_data:
+            readers.append(_feed_stdin(process.stdin, input_data.encode()))
+        (stdout, stdout_cut), (stderr, stderr_cut), *_ = await asyncio.gather(*readers)
+        await process.wait()
         
-        stdout, stderr = await process.communicate(
-            input=input_data.encode() if input_data else None
-        )
-        
-        return {
+        result = {
             "return_code": process.returncode,
-            "stdout": stdout.decode() if stdout else "",
-            "stderr": stderr.decode() if stderr else "",
+            "stdout": stdout.decode("utf-8", "replace"),
+            "stderr": stderr.decode("utf-8", "replace"),
             "command": cmd
         }
+        if stdout_cut or stderr_cut:
+            result["truncated"] = True
+        return result
         
     except Exception as e:
         return {
@@ -309,13 +403,6 @@ async def run_command(
 
 def format_error(message: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Format an error response with context."""
-    error_response = {
-        "error": True,
-        "message": message,
-        "timestamp": time.time()
-    }
-    
     if context:
-        error_response["context"] = context
-        
-    return error_response
+        return {"error": True, "message": message, "timestamp": time.time(), "context": context}
+    return {"error": True, "message": message, "timestamp": time.time()}
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import base64
+import subprocess
 import tempfile
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, List, Optional, Union
@@ -403,8 +404,6 @@ try {{
 
     def create_setup_iso(self, output_path: str, license_key: Optional[str] = None) -> str:
         """Create Windows setup ISO with autounattend.xml and scripts."""
-        import subprocess
-        
         with tempfile.TemporaryDirectory() as temp_dir:
             # Generate autounattend.xml
             autounattend_xml = self.generate_autounattend_xml()
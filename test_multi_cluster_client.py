@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test MultiClusterProxmoxClient argument forwarding without a live cluster
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root / "src"))
+
+from proxmox_mcp.multi_cluster_client import MultiClusterProxmoxClient
+
+
+class FakeClient:
+    """Records the calls forwarded to it."""
+
+    def __init__(self, cluster):
+        self.cluster = cluster
+        self.calls = []
+
+    def __getattr__(self, method):
+        def record(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+            return self.cluster
+        return record
+
+
+class FakeRegistry:
+    """Two clusters; selects the requested one, else the first."""
+
+    def __init__(self):
+        self.clients = {name: FakeClient(name) for name in ("dev", "prod")}
+
+    def list_clusters(self):
+        return list(self.clients)
+
+    def select_cluster(self, cluster_name=None, resource_name=None):
+        return cluster_name or "dev"
+
+    def get_client(self, name):
+        return self.clients[name]
+
+
+def test_positional_cluster():
+    """cluster may be passed positionally after the method's own arguments"""
+    registry = FakeRegistry()
+    client = MultiClusterProxmoxClient(registry=registry, read_cache_ttl=0)
+
+    assert client.start_vm("pve", 100, "prod") == "prod"
+    assert client.stop_vm("pve", 100, True, 30, "prod") == "prod"
+    assert client.list_vms(None, None, None, "prod") == "prod"
+    assert client.storage_status("pve", "local", "prod") == "prod"
+
+    assert registry.clients["prod"].calls == [
+        ("start_vm", ("pve", 100), {}),
+        ("stop_vm", ("pve", 100, True, 30), {}),
+        ("list_vms", (None, None, None), {}),
+        ("storage_status", ("pve", "local"), {}),
+    ]
+    assert registry.clients["dev"].calls == []
+
+
+def test_keyword_cluster():
+    """cluster by keyword, or omitted, still selects the cluster"""
+    registry = FakeRegistry()
+    client = MultiClusterProxmoxClient(registry=registry, read_cache_ttl=0)
+
+    assert client.start_vm("pve", 100, cluster="prod") == "prod"
+    assert client.start_vm(node="pve", vmid=101) == "dev"
+    assert registry.clients["prod"].calls == [("start_vm", ("pve", 100), {})]
+    assert registry.clients["dev"].calls == [("start_vm", ("pve", 101), {})]
+
+
+if __name__ == "__main__":
+    test_positional_cluster()
+    test_keyword_cluster()
+    print("✅ All tests passed")
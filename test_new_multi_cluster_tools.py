@@ -5,6 +5,7 @@ Test the new multi-cluster aggregation tools
 
 import sys
 import asyncio
+from collections import Counter
 from pathlib import Path
 
 # Add src to path
@@ -70,8 +71,9 @@ async def test_list_all_vms():
             if isinstance(vms, dict) and "error" in vms:
                 print(f"  ❌ {cluster_name}: {vms['error']}")
             else:
-                running = len([vm for vm in vms if vm.get('status') == 'running'])
-                stopped = len([vm for vm in vms if vm.get('status') == 'stopped'])
+                statuses = Counter(vm.get('status') for vm in vms)
+                running = statuses['running']
+                stopped = statuses['stopped']
                 print(f"  ✅ {cluster_name}: {len(vms)} VMs ({running} running, {stopped} stopped)")
         
         return True
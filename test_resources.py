@@ -47,17 +47,34 @@ async def main():
     print("CLUSTER RESOURCES")
     print("=" * 80)
     
-    for cluster_name in cluster_names:
+    async def probe(cluster_name):
+        """Fetch nodes, VMs, containers and storage for one cluster concurrently."""
+        client = registry.get_client(cluster_name)
+        return await asyncio.gather(
+            asyncio.to_thread(client.list_nodes),
+            asyncio.to_thread(client.list_vms),
+            asyncio.to_thread(client.list_lxc),
+            asyncio.to_thread(client.list_storage),
+        )
+    
+    # Query every cluster at once, then print the results in cluster order
+    results = await asyncio.gather(
+        *(probe(cluster_name) for cluster_name in cluster_names),
+        return_exceptions=True,
+    )
+    
+    for cluster_name, result in zip(cluster_names, results):
         cluster_display_name = cluster_name.upper()
         print(f"\n{cluster_display_name} CLUSTER RESOURCES")
         print("-" * 80)
         
         try:
-            client = registry.get_client(cluster_name)
+            if isinstance(result, Exception):
+                raise result
+            nodes, vms, containers, storage = result
             
             # List nodes
             print(f"\n📍 Nodes in {cluster_display_name}:")
-            nodes = client.list_nodes()
             for node in nodes:
                 node_name = node.get('node', 'N/A')
                 node_status = node.get('status', 'N/A')
@@ -73,7 +90,6 @@ async def main():
             
             # List VMs
             print(f"\n🖥️  Virtual Machines in {cluster_display_name}:")
-            vms = client.list_vms()
             if vms:
                 for vm in vms:
                     vm_name = vm.get('name', 'N/A')
@@ -90,7 +106,6 @@ async def main():
             
             # List LXC Containers
             print(f"\n📦 LXC Containers in {cluster_display_name}:")
-            containers = client.list_lxc()
             if containers:
                 for container in containers:
                     ct_name = container.get('name', 'N/A')
@@ -107,7 +122,6 @@ async def main():
             
             # List Storage
             print(f"\n💾 Storage in {cluster_display_name}:")
-            storage = client.list_storage()
             if storage:
                 for store in storage:
                     store_id = store.get('storage', 'N/A')